@@ -5,6 +5,7 @@
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -66,15 +67,13 @@ def cmd_list(args: argparse.Namespace) -> int:
                 try:
                     report_xml = storage.get_report(report_hash)
                     metadata = extract_metadata_from_xml(report_xml)
-                    report_file = storage_path / "reports" / f"{report_hash}.xml"
                     report_data.append(
                         {
                             "hash": report_hash,
                             "timestamp": metadata.get("jux:timestamp", "N/A"),
                             "hostname": metadata.get("jux:hostname", "N/A"),
-                            "size": report_file.stat().st_size
-                            if report_file.exists()
-                            else 0,
+                            # The report was just read whole; no need to stat it
+                            "size": len(report_xml),
                         }
                     )
                 except StorageError:
@@ -232,15 +231,19 @@ def cmd_clean(args: argparse.Namespace) -> int:
         cutoff_time = datetime.now() - timedelta(days=args.days)
         cutoff_timestamp = cutoff_time.timestamp()
 
-        reports = storage.list_reports()
         reports_to_delete = []
 
-        # Find reports older than cutoff
-        for report_hash in reports:
-            report_file = storage_path / "reports" / f"{report_hash}.xml"
-            if report_file.exists():
-                mtime = report_file.stat().st_mtime
-                if mtime < cutoff_timestamp:
+        # Find reports older than cutoff in one directory pass, reading each
+        # report's mtime from its scandir entry
+        with os.scandir(storage_path / "reports") as entries:
+            for entry in entries:
+                report_hash, ext = os.path.splitext(entry.name)
+                if (
+                    ext == ".xml"
+                    and report_hash
+                    and entry.is_file()
+                    and entry.stat().st_mtime < cutoff_timestamp
+                ):
                     reports_to_delete.append(report_hash)
 
         if args.dry_run:
@@ -96,10 +96,17 @@ def save_key(key: PrivateKeyTypes, output_path: Path) -> None:
         encryption_algorithm=serialization.NoEncryption(),
     )
 
-    # Write key to file
-    output_path.write_bytes(pem_data)
+    # Create the file owner read/write only, so the key is never readable by
+    # others, not even between writing it and fixing its permissions
+    fd = os.open(
+        output_path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o600,
+    )
+    with os.fdopen(fd, "wb") as f:
+        f.write(pem_data)
 
-    # Set secure file permissions (owner read/write only)
+    # Also enforce 0600 on an overwritten file and regardless of the umask
     output_path.chmod(0o600)
 
 
@@ -38,6 +38,9 @@ examples:
   Publish single report:
     jux-publish --file report.xml --api-url https://jux.example.com/api/v1
 
+  Publish a report from stdin:
+    jux-sign -i report.xml --key $CI_KEY | jux-publish --file - --api-url $JUX_API_URL
+
   Publish all queued reports:
     jux-publish --queue --api-url https://jux.example.com/api/v1
 
@@ -96,7 +99,7 @@ For detailed documentation, see:
         "-f",
         "--file",
         type=Path,
-        help="Path to signed JUnit XML file to publish",
+        help="Path to signed JUnit XML file to publish ('-' reads standard input)",
         metavar="FILE",
     )
     source_group.add_argument(
@@ -189,7 +192,7 @@ def publish_single_file(
     """Publish a single XML file to Jux API.
 
     Args:
-        file_path: Path to signed XML file
+        file_path: Path to signed XML file, or ``-`` for standard input
         client: Configured JuxAPIClient
         dry_run: If True, don't actually publish
         verbose: Show detailed progress
@@ -205,12 +208,16 @@ def publish_single_file(
         "test_run_id": None,
     }
 
-    if not file_path.exists():
+    from_stdin = str(file_path) == "-"
+    if not from_stdin and not file_path.exists():
         result["error"] = f"File not found: {file_path}"
         return False, result
 
     try:
-        xml_content = file_path.read_text(encoding="utf-8")
+        if from_stdin:
+            xml_content = sys.stdin.read()
+        else:
+            xml_content = file_path.read_text(encoding="utf-8")
     except Exception as e:
         result["error"] = f"Failed to read file: {e}"
         return False, result
@@ -280,8 +287,7 @@ def publish_queue(
 
         try:
             # Read queued report
-            queue_file = storage.storage_path / "queue" / f"{report_hash}.xml"
-            xml_content = queue_file.read_text(encoding="utf-8")
+            xml_content = storage.get_queued_report(report_hash).decode("utf-8")
         except Exception as e:
             result["error"] = f"Failed to read queued report: {e}"
             failure_count += 1
@@ -325,148 +331,280 @@ def publish_queue(
     return success_count, failure_count, results
 
 
-def main(args: list[str] | None = None) -> int:
-    """Main entry point for jux-publish command.
+class PublishCommand:
+    """Reusable jux-publish runner holding a single API client.
 
-    Args:
-        args: Command line arguments (for testing). If None, uses sys.argv.
+    The JuxAPIClient is built once in ``__init__``, so several publishes from
+    the same process share its connection pool instead of reconnecting.
 
-    Returns:
-        Exit code:
-        - 0: All reports published successfully
-        - 1: All reports failed to publish
-        - 2: Partial success (some failed)
+    Example:
+        >>> with PublishCommand(api_url="http://localhost:4000/api/v1") as cmd:
+        ...     exit_code = cmd.execute([Path("report.xml")])
     """
-    parser = create_parser()
-
-    # Get debug mode from environment
-    debug = os.getenv("JUX_DEBUG") == "1"
-
-    try:
-        parsed_args = parser.parse_args(args)
 
-        # Initialize API client
-        client = JuxAPIClient(
-            api_url=parsed_args.api_url,
-            bearer_token=parsed_args.bearer_token,
-            timeout=parsed_args.timeout,
-            max_retries=parsed_args.max_retries,
+    def __init__(
+        self,
+        api_url: str,
+        bearer_token: str | None = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        *,
+        dry_run: bool = False,
+        verbose: bool = False,
+        json_output: bool = False,
+    ) -> None:
+        """Initialize the command and its API client.
+
+        Args:
+            api_url: Jux API base URL
+            bearer_token: Optional Bearer token for remote authentication
+            timeout: API request timeout in seconds
+            max_retries: Maximum retry attempts for transient failures
+            dry_run: Show what would be published without publishing
+            verbose: Show detailed progress information
+            json_output: Print results as JSON
+        """
+        self.client = JuxAPIClient(
+            api_url=api_url,
+            bearer_token=bearer_token,
+            timeout=timeout,
+            max_retries=max_retries,
         )
+        self.dry_run = dry_run
+        self.verbose = verbose
+        self.json_output = json_output
 
-        json_result: dict = {
+    def _new_json_result(self) -> dict:
+        """Return an empty JSON result document."""
+        return {
             "success": False,
-            "dry_run": parsed_args.dry_run,
+            "dry_run": self.dry_run,
             "published": 0,
             "failed": 0,
             "results": [],
         }
 
-        if parsed_args.file:
-            # Single file mode
-            if not parsed_args.json and not parsed_args.dry_run:
-                console.print(f"[bold]Publishing report:[/bold] {parsed_args.file}")
+    def _report_summary(self, json_result: dict, results: list[dict]) -> int:
+        """Print the outcome of a multi-report publish and return its exit code.
 
-            success, result = publish_single_file(
-                file_path=parsed_args.file,
-                client=client,
-                dry_run=parsed_args.dry_run,
-                verbose=parsed_args.verbose,
-                json_output=parsed_args.json,
-            )
+        Args:
+            json_result: JSON result document to fill in
+            results: Per-report result dictionaries
 
-            json_result["results"].append(result)
+        Returns:
+            Exit code (0 all published, 1 all failed, 2 partial success)
+        """
+        success_count = sum(1 for result in results if result["success"])
+        failure_count = len(results) - success_count
 
-            if success:
-                json_result["success"] = True
-                json_result["published"] = 1
-
-                if parsed_args.json:
-                    print(json.dumps(json_result, indent=2))
-                elif not parsed_args.verbose:
-                    if parsed_args.dry_run:
-                        console.print(
-                            "[yellow]Dry run:[/yellow] Would publish 1 report"
-                        )
-                    else:
-                        console.print("[green]✓[/green] Report published successfully")
-                        if result.get("test_run_id"):
-                            console.print(f"  Test run ID: {result['test_run_id']}")
-
-                return 0
+        json_result["published"] = success_count
+        json_result["failed"] = failure_count
+        json_result["results"] = results
+        json_result["success"] = failure_count == 0
+
+        if self.json_output:
+            print(json.dumps(json_result, indent=2))
+        elif not self.verbose:
+            if self.dry_run:
+                console.print(
+                    f"[yellow]Dry run:[/yellow] Would publish {len(results)} report(s)"
+                )
             else:
-                json_result["failed"] = 1
+                if failure_count == 0:
+                    console.print(
+                        f"[green]✓[/green] All {success_count} report(s) published successfully"
+                    )
+                elif success_count == 0:
+                    console.print(
+                        f"[red]✗[/red] All {failure_count} report(s) failed to publish"
+                    )
+                else:
+                    console.print(
+                        f"[yellow]⚠[/yellow] Published {success_count}, failed {failure_count}"
+                    )
+
+        # Exit codes
+        if failure_count == 0:
+            return 0  # All success
+        elif success_count == 0:
+            return 1  # All failed
+        else:
+            return 2  # Partial success
+
+    def execute(self, files: list[Path]) -> int:
+        """Publish several XML files and report the combined outcome.
+
+        Args:
+            files: Signed XML report files to publish
 
-                if parsed_args.json:
-                    print(json.dumps(json_result, indent=2))
-                elif not parsed_args.verbose:
-                    console.print("[red]✗[/red] Failed to publish report")
-                    if result.get("error"):
-                        console.print(f"  Error: {result['error']}")
+        Returns:
+            Exit code (0 all published, 1 all failed or no files given,
+            2 partial success)
+        """
+        json_result = self._new_json_result()
 
-                return 1
+        if not files:
+            if self.json_output:
+                json_result["error"] = "No files to publish"
+                print(json.dumps(json_result, indent=2))
+            else:
+                console_err.print("[red]Error:[/red] No files to publish")
+            return 1
+
+        if not self.json_output and not self.dry_run:
+            console.print(f"[bold]Publishing {len(files)} report(s)...[/bold]")
+
+        results = [
+            publish_single_file(
+                file_path=file_path,
+                client=self.client,
+                dry_run=self.dry_run,
+                verbose=self.verbose,
+                json_output=self.json_output,
+            )[1]
+            for file_path in files
+        ]
+
+        return self._report_summary(json_result, results)
+
+    def execute_file(self, file_path: Path) -> int:
+        """Publish a single XML file and report the outcome.
+
+        Args:
+            file_path: Signed XML report file, or ``-`` for standard input
+
+        Returns:
+            Exit code (0 success, 1 failure)
+        """
+        json_result = self._new_json_result()
+
+        if not self.json_output and not self.dry_run:
+            console.print(f"[bold]Publishing report:[/bold] {file_path}")
+
+        success, result = publish_single_file(
+            file_path=file_path,
+            client=self.client,
+            dry_run=self.dry_run,
+            verbose=self.verbose,
+            json_output=self.json_output,
+        )
 
-        elif parsed_args.queue:
-            # Queue mode
-            storage_path = parsed_args.storage_path or get_default_storage_path()
-            storage = ReportStorage(storage_path=storage_path)
+        json_result["results"].append(result)
 
-            queued_count = len(storage.list_queued_reports())
+        if success:
+            json_result["success"] = True
+            json_result["published"] = 1
 
-            if queued_count == 0:
-                if parsed_args.json:
-                    json_result["success"] = True
-                    json_result["message"] = "No reports in queue"
-                    print(json.dumps(json_result, indent=2))
+            if self.json_output:
+                print(json.dumps(json_result, indent=2))
+            elif not self.verbose:
+                if self.dry_run:
+                    console.print("[yellow]Dry run:[/yellow] Would publish 1 report")
                 else:
-                    console.print("[yellow]No reports in queue[/yellow]")
-                return 0
+                    console.print("[green]✓[/green] Report published successfully")
+                    if result.get("test_run_id"):
+                        console.print(f"  Test run ID: {result['test_run_id']}")
 
-            if not parsed_args.json and not parsed_args.dry_run:
-                console.print(
-                    f"[bold]Publishing {queued_count} queued report(s)...[/bold]"
-                )
+            return 0
+        else:
+            json_result["failed"] = 1
+
+            if self.json_output:
+                print(json.dumps(json_result, indent=2))
+            elif not self.verbose:
+                console.print("[red]✗[/red] Failed to publish report")
+                if result.get("error"):
+                    console.print(f"  Error: {result['error']}")
+
+            return 1
+
+    def execute_queue(self, storage_path: Path | None = None) -> int:
+        """Publish all queued reports and report the outcome.
 
-            success_count, failure_count, results = publish_queue(
-                storage=storage,
-                client=client,
-                dry_run=parsed_args.dry_run,
-                verbose=parsed_args.verbose,
-                json_output=parsed_args.json,
-            )
+        Args:
+            storage_path: Queue storage path (default: platform-specific)
 
-            json_result["published"] = success_count
-            json_result["failed"] = failure_count
-            json_result["results"] = results
-            json_result["success"] = failure_count == 0
+        Returns:
+            Exit code (0 all published, 1 all failed, 2 partial success)
+        """
+        json_result = self._new_json_result()
+        storage = ReportStorage(storage_path=storage_path or get_default_storage_path())
 
-            if parsed_args.json:
+        queued_count = len(storage.list_queued_reports())
+
+        if queued_count == 0:
+            if self.json_output:
+                json_result["success"] = True
+                json_result["message"] = "No reports in queue"
                 print(json.dumps(json_result, indent=2))
-            elif not parsed_args.verbose:
-                if parsed_args.dry_run:
-                    console.print(
-                        f"[yellow]Dry run:[/yellow] Would publish {queued_count} report(s)"
-                    )
-                else:
-                    if failure_count == 0:
-                        console.print(
-                            f"[green]✓[/green] All {success_count} report(s) published successfully"
-                        )
-                    elif success_count == 0:
-                        console.print(
-                            f"[red]✗[/red] All {failure_count} report(s) failed to publish"
-                        )
-                    else:
-                        console.print(
-                            f"[yellow]⚠[/yellow] Published {success_count}, failed {failure_count}"
-                        )
-
-            # Exit codes
-            if failure_count == 0:
-                return 0  # All success
-            elif success_count == 0:
-                return 1  # All failed
             else:
-                return 2  # Partial success
+                console.print("[yellow]No reports in queue[/yellow]")
+            return 0
+
+        if not self.json_output and not self.dry_run:
+            console.print(f"[bold]Publishing {queued_count} queued report(s)...[/bold]")
+
+        _, _, results = publish_queue(
+            storage=storage,
+            client=self.client,
+            dry_run=self.dry_run,
+            verbose=self.verbose,
+            json_output=self.json_output,
+        )
+
+        return self._report_summary(json_result, results)
+
+    def close(self) -> None:
+        """Close the API client and release its connections."""
+        self.client.close()
+
+    def __enter__(self) -> "PublishCommand":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Context manager exit - closes the API client."""
+        self.close()
+
+
+def main(args: list[str] | None = None) -> int:
+    """Main entry point for jux-publish command.
+
+    Args:
+        args: Command line arguments (for testing). If None, uses sys.argv.
+
+    Returns:
+        Exit code:
+        - 0: All reports published successfully
+        - 1: All reports failed to publish
+        - 2: Partial success (some failed)
+    """
+    parser = create_parser()
+
+    # Get debug mode from environment
+    debug = os.getenv("JUX_DEBUG") == "1"
+
+    try:
+        parsed_args = parser.parse_args(args)
+
+        with PublishCommand(
+            api_url=parsed_args.api_url,
+            bearer_token=parsed_args.bearer_token,
+            timeout=parsed_args.timeout,
+            max_retries=parsed_args.max_retries,
+            dry_run=parsed_args.dry_run,
+            verbose=parsed_args.verbose,
+            json_output=parsed_args.json,
+        ) as command:
+            if parsed_args.file:
+                return command.execute_file(parsed_args.file)
+            elif parsed_args.queue:
+                return command.execute_queue(parsed_args.storage_path)
 
         return 0
 
@@ -165,6 +165,12 @@ def main() -> int:
         if args.input and not args.input.exists():
             raise FileNotFoundError(args.input, file_type="input XML file")
 
+        # Fail on an unwritable output location before doing any signing work
+        if args.output:
+            target = args.output if args.output.exists() else args.output.parent
+            if target.exists() and not os.access(target, os.W_OK):
+                raise PermissionError(f"Cannot write to {args.output}")
+
         # Determine if we're in quiet mode (outputting to stdout)
         quiet = args.output is None
 
@@ -3,10 +3,12 @@
 
 """CLI command for verifying XML signature."""
 
+import functools
 import json
 import os
 import sys
 from pathlib import Path
+from typing import BinaryIO
 
 import configargparse
 from lxml import etree
@@ -141,66 +143,78 @@ For detailed documentation, see:
     return parser
 
 
-def main() -> int:
-    """Verify XML digital signature.
+def verify_file(
+    input_path: Path | None,
+    cert_path: Path,
+    *,
+    quiet: bool = False,
+    json_output: bool = False,
+    stdin: BinaryIO | None = None,
+) -> int:
+    """Verify the XML digital signature of a report.
+
+    Args:
+        input_path: Signed XML report, or None to read it from ``stdin``
+        cert_path: X.509 certificate used to verify the signature
+        quiet: Suppress human-readable output
+        json_output: Print the result as JSON
+        stdin: Binary stream read when ``input_path`` is None
+            (default: sys.stdin.buffer)
 
     Returns:
         Exit code (0 for valid signature, 1 for invalid/error)
     """
-    parser = create_parser()
-    args = parser.parse_args()
-
     # Get debug mode from environment
     debug = os.getenv("JUX_DEBUG") == "1"
 
     try:
         # Validate input file if provided
-        if args.input and not args.input.exists():
-            if args.json:
+        if input_path and not input_path.exists():
+            if json_output:
                 print(json.dumps({"valid": False, "error": "Input file not found"}))
                 return 1
-            elif not args.quiet:
-                FileNotFoundError(args.input, file_type="input XML file").print_error()
+            elif not quiet:
+                FileNotFoundError(input_path, file_type="input XML file").print_error()
             return 1
 
         # Validate certificate file
-        if not args.cert.exists():
-            if args.json:
+        if not cert_path.exists():
+            if json_output:
                 print(json.dumps({"valid": False, "error": "Certificate not found"}))
                 return 1
-            elif not args.quiet:
-                CertNotFoundError(args.cert).print_error()
+            elif not quiet:
+                CertNotFoundError(cert_path).print_error()
             return 1
 
         # Read XML from file or stdin
-        if args.input:
+        if input_path:
             try:
-                tree = load_xml(args.input)
+                tree = load_xml(input_path)
             except etree.XMLSyntaxError as e:
-                if args.json:
+                if json_output:
                     print(
                         json.dumps({"valid": False, "error": f"XML parse error: {e}"})
                     )
                     return 1
-                elif not args.quiet:
-                    XMLParseError(args.input, str(e)).print_error()
+                elif not quiet:
+                    XMLParseError(input_path, str(e)).print_error()
                 return 1
         else:
-            xml_content = sys.stdin.read()
+            xml_content = (stdin or sys.stdin.buffer).read()
             try:
-                tree = etree.fromstring(xml_content.encode("utf-8"))  # noqa: S320
+                tree = etree.fromstring(xml_content)  # noqa: S320
             except etree.XMLSyntaxError as e:
-                if args.json:
+                if json_output:
                     print(
                         json.dumps({"valid": False, "error": f"XML parse error: {e}"})
                     )
                     return 1
-                elif not args.quiet:
+                elif not quiet:
                     XMLParseError(None, str(e)).print_error()
                 return 1
 
         # Read certificate
-        cert = args.cert.read_bytes()
+        cert = cert_path.read_bytes()
 
         # Verify signature
         try:
@@ -209,29 +223,29 @@ def main() -> int:
             error_msg = str(e)
             # Check if signature is missing
             if "signature" in error_msg.lower() and "not found" in error_msg.lower():
-                if args.json:
+                if json_output:
                     print(json.dumps({"valid": False, "error": "Signature not found"}))
                     return 1
-                elif not args.quiet:
-                    xml_path = args.input if args.input else None
+                elif not quiet:
+                    xml_path = input_path if input_path else None
                     XMLSignatureMissingError(xml_path).print_error()
                 return 1
             else:
                 # Signature invalid
-                if args.json:
+                if json_output:
                     print(json.dumps({"valid": False, "error": error_msg}))
                     return 1
-                elif not args.quiet:
+                elif not quiet:
                     XMLSignatureInvalidError(error_msg).print_error()
                 return 1
 
         # Output result
-        if args.json:
+        if json_output:
             result = {
                 "valid": is_valid,
             }
             print(json.dumps(result))
-        elif not args.quiet:
+        elif not quiet:
             if is_valid:
                 console.print("[green]✓[/green] Signature is valid")
             else:
@@ -240,13 +254,13 @@ def main() -> int:
         return 0 if is_valid else 1
 
     except Exception as e:
-        if args.json:
+        if json_output:
             error_result: dict[str, bool | str] = {
                 "valid": False,
                 "error": str(e),
             }
             print(json.dumps(error_result))
-        elif not args.quiet:
+        elif not quiet:
             # Handle unexpected errors in non-debug mode
             if debug:
                 raise
@@ -265,5 +279,25 @@ def main() -> int:
         return 1
 
 
+@functools.cache
+def _get_parser() -> configargparse.ArgumentParser:
+    """Build the argument parser once per process and reuse it."""
+    return create_parser()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Verify XML digital signature.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (0 for valid signature, 1 for invalid/error)
+    """
+    args = _get_parser().parse_args(argv)
+
+    return verify_file(args.input, args.cert, quiet=args.quiet, json_output=args.json)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -8,18 +8,138 @@ reports, signing them with XMLDSig, and publishing them to the Jux API.
 """
 
 import os
+import sys
+import threading
+import warnings
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
+from typing import Any
 
 import pytest
 from lxml import etree
 
-from pytest_jux.api_client import JuxAPIClient
+from pytest_jux.api_client import JuxAPIClient, PublishResponse
 from pytest_jux.canonicalizer import compute_canonical_hash, load_xml
 from pytest_jux.config import ConfigurationManager, StorageMode
 from pytest_jux.signer import load_private_key, sign_xml
 from pytest_jux.storage import ReportStorage
 
 
+def _publish_report(client_options: dict[str, Any], xml_string: str) -> PublishResponse:
+    """Publish a report and close the client (runs on the publish thread).
+
+    The client is built here so that a construction error is reported by
+    _wait_for_publish() like any other publishing failure.
+
+    Args:
+        client_options: Keyword arguments for JuxAPIClient
+        xml_string: Serialized JUnit XML report
+
+    Returns:
+        API response for the published report
+    """
+    client = JuxAPIClient(**client_options)
+    try:
+        return client.publish_report(xml_string)
+    finally:
+        client.close()
+
+
+def _start_publish(
+    client_options: dict[str, Any], xml_string: str
+) -> Future[PublishResponse]:
+    """Publish a report on a background thread.
+
+    The HTTP round-trip overlaps the rest of session teardown instead of
+    blocking sessionfinish. The thread is a daemon, so a publish that
+    _wait_for_publish() gives up on does not keep the interpreter alive.
+
+    Args:
+        client_options: Keyword arguments for JuxAPIClient
+        xml_string: Serialized JUnit XML report
+
+    Returns:
+        Future resolved with the API response or the publishing error
+    """
+    future: Future[PublishResponse] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return  # pragma: no cover
+        try:
+            response = _publish_report(client_options, xml_string)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(response)
+
+    threading.Thread(target=run, name="jux-publish", daemon=True).start()
+    return future
+
+
+def _warn(message: str) -> None:
+    """Emit a publishing message as a pytest warning."""
+    warnings.warn(message, stacklevel=3)
+
+
+def _print_to_stderr(message: str) -> None:
+    """Write a publishing message straight to stderr."""
+    print(f"pytest-jux: {message}", file=sys.stderr)
+
+
+def _wait_for_publish(config: pytest.Config, emit: Callable[[str], None]) -> None:
+    """Wait for a background publish started by sessionfinish and report it.
+
+    Emits the same messages the plugin has always used for publishing
+    success and failure. Does nothing if no publish is pending.
+
+    Args:
+        config: pytest configuration object
+        emit: Callable that shows a message to the user
+    """
+    future = getattr(config, "_jux_publish_future", None)
+    if not isinstance(future, Future):
+        return
+    config._jux_publish_future = None  # type: ignore[attr-defined]
+
+    storage_mode = getattr(config, "_jux_storage_mode", None)
+    timeout = getattr(config, "_jux_publish_wait_timeout", None)
+
+    try:
+        response = future.result(timeout=timeout)
+    except FutureTimeoutError:
+        emit(
+            f"Timed out after {timeout}s waiting to publish report to Jux API; "
+            "the report may not have been published"
+        )
+        return
+    except Exception as api_error:
+        # Handle API errors based on storage mode
+        if storage_mode == StorageMode.API:
+            # API mode: fail if API publishing fails
+            emit(f"Failed to publish report to Jux API (API mode): {api_error}")
+        elif storage_mode == StorageMode.CACHE:
+            # CACHE mode: queue for later (graceful degradation)
+            emit(
+                f"Failed to publish report to Jux API, queued locally (CACHE mode): {api_error}"
+            )
+            # Note: Report already stored locally in sessionfinish
+        else:
+            # BOTH mode: warn but continue (local copy exists)
+            emit(
+                f"Failed to publish report to Jux API, local copy saved (BOTH mode): {api_error}"
+            )
+        return
+
+    # Log success (visible in pytest output)
+    emit(
+        f"Report published to Jux API: test_run_id={response.test_run_id}, "
+        f"success_rate={response.success_rate}%"
+    )
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add plugin command-line options.
 
@@ -247,6 +367,8 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     and a JUnit XML report was generated, it:
     1. Signs the report (if signing is enabled)
     2. Stores the report (signed or unsigned) according to storage mode
+    3. Starts publishing the report to the Jux API in the background (if
+       configured); the outcome is reported at the end of the run
 
     Note: Environment metadata is captured by pytest_metadata() hook and included
     in the JUnit XML <properties> elements before signing. The XMLDSig signature
@@ -300,15 +422,14 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
             tree = sign_xml(tree, key, cert)
 
             # Write signed XML back to file
-            with open(xml_path, "wb") as f:
-                f.write(
-                    etree.tostring(
-                        tree,
-                        xml_declaration=True,
-                        encoding="utf-8",
-                        pretty_print=True,
-                    )
+            xml_path.write_bytes(
+                etree.tostring(
+                    tree,
+                    xml_declaration=True,
+                    encoding="utf-8",
+                    pretty_print=True,
                 )
+            )
 
         # Compute canonical hash
         canonical_hash = compute_canonical_hash(tree)
@@ -356,57 +477,55 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
                 tree, xml_declaration=True, encoding="utf-8", pretty_print=True
             ).decode("utf-8")
 
-            try:
-                # Initialize API client
-                client = JuxAPIClient(
-                    api_url=api_url,
-                    bearer_token=bearer_token,
-                    timeout=api_timeout,
-                    max_retries=api_max_retries,
-                )
+            # Publish in the background; the result is collected (and
+            # reported) by _wait_for_publish() at the end of the run
+            client_options = {
+                "api_url": api_url,
+                "bearer_token": bearer_token,
+                "timeout": api_timeout,
+                "max_retries": api_max_retries,
+            }
+            session.config._jux_publish_future = _start_publish(  # type: ignore[attr-defined]
+                client_options, xml_string
+            )
+            # Allow every attempt its full timeout plus the retry backoff
+            session.config._jux_publish_wait_timeout = (  # type: ignore[attr-defined]
+                api_timeout * (api_max_retries + 1) + 2**api_max_retries
+            )
+
+    except Exception as e:
+        # Report error but don't fail the test run
+        warnings.warn(f"Failed to process JUnit XML report: {e}", stacklevel=2)
 
-                # Publish report to Jux API v1.0.0
-                response = client.publish_report(xml_string)
 
-                # Log success (visible in pytest output)
-                import warnings
+@pytest.hookimpl(trylast=True)
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter,
+    exitstatus: int,
+    config: pytest.Config,
+) -> None:
+    """Collect the background publish result while the summary is shown.
 
-                warnings.warn(
-                    f"Report published to Jux API: test_run_id={response.test_run_id}, "
-                    f"success_rate={response.success_rate}%",
-                    stacklevel=2,
-                )
+    Running last lets the failure and error sections render while the
+    report is still being published, and any warning emitted here still
+    appears in the run's warnings summary.
 
-            except Exception as api_error:
-                # Handle API errors based on storage mode
-                if storage_mode == StorageMode.API:
-                    # API mode: fail if API publishing fails
-                    import warnings
+    Args:
+        terminalreporter: pytest terminal reporter
+        exitstatus: pytest exit status code
+        config: pytest configuration object
+    """
+    _wait_for_publish(config, _warn)
 
-                    warnings.warn(
-                        f"Failed to publish report to Jux API (API mode): {api_error}",
-                        stacklevel=2,
-                    )
-                elif storage_mode == StorageMode.CACHE:
-                    # CACHE mode: queue for later (graceful degradation)
-                    import warnings
 
-                    warnings.warn(
-                        f"Failed to publish report to Jux API, queued locally (CACHE mode): {api_error}",
-                        stacklevel=2,
-                    )
-                    # Note: Report already stored locally above
-                else:
-                    # BOTH mode: warn but continue (local copy exists)
-                    import warnings
-
-                    warnings.warn(
-                        f"Failed to publish report to Jux API, local copy saved (BOTH mode): {api_error}",
-                        stacklevel=2,
-                    )
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Collect the background publish result if it is still pending.
 
-    except Exception as e:
-        # Report error but don't fail the test run
-        import warnings
+    Covers runs without a terminal reporter, where pytest_terminal_summary
+    is never called. pytest no longer records warnings at this point, so
+    the outcome is written to stderr instead.
 
-        warnings.warn(f"Failed to process JUnit XML report: {e}", stacklevel=2)
+    Args:
+        config: pytest configuration object
+    """
+    _wait_for_publish(config, _print_to_stderr)
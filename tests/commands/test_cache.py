@@ -78,6 +78,7 @@ class TestCacheList:
         assert "reports" in data
         assert len(data["reports"]) == 1
         assert data["reports"][0]["hash"] == "sha256:test1"
+        assert data["reports"][0]["size"] == len(b"<testsuite name='test1'/>")
 
     def test_list_with_custom_storage_path(
         self, tmp_path: Path, capsys: pytest.CaptureFixture
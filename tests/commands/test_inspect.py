@@ -9,15 +9,12 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from conftest import generate_test_rsa_key
 from lxml import etree
 
 from pytest_jux.canonicalizer import load_xml
 from pytest_jux.commands.inspect import main
-from pytest_jux.commands.keygen import (
-    generate_rsa_key,
-    generate_self_signed_cert,
-    save_key,
-)
+from pytest_jux.commands.keygen import generate_self_signed_cert, save_key
 from pytest_jux.signer import sign_xml
 
 
@@ -62,7 +59,7 @@ def signed_xml(tmp_path: Path) -> Path:
     xml_path.write_text(xml_content)
 
     # Generate key and certificate
-    key = generate_rsa_key(2048)
+    key = generate_test_rsa_key()
     key_path = tmp_path / "key.pem"
     save_key(key, key_path)
 
@@ -4,19 +4,126 @@
 """Tests for jux-publish command."""
 
 import json
+import sys
+from collections.abc import Callable, Iterator
+from io import StringIO
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any
 
 import pytest
 import requests
 
 from pytest_jux.api_client import PublishResponse
-from pytest_jux.commands.publish import main
-from pytest_jux.storage import ReportStorage
+from pytest_jux.commands import publish as publish_cmd
+from pytest_jux.commands.publish import PublishCommand, main
+from pytest_jux.storage import QueuedReportNotFoundError, ReportStorage
+
+
+class _StubClient:
+    """Lightweight stand-in for JuxAPIClient.
+
+    The stub replaces both the class and its instance: calling it records the
+    constructor keyword arguments and returns the stub itself. Each
+    ``publish_report`` call is recorded and answered from ``side_effect``
+    (an exception or an iterator of results/exceptions) or ``result``.
+    """
+
+    def __init__(self) -> None:
+        self.init_kwargs: list[dict[str, Any]] = []
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.result: Any = None
+        self.side_effect: BaseException | Iterator[Any] | None = None
+
+    def __call__(self, **kwargs: Any) -> "_StubClient":
+        self.init_kwargs.append(kwargs)
+        return self
+
+    def publish_report(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        outcome = self.result
+        if isinstance(self.side_effect, BaseException):
+            outcome = self.side_effect
+        elif self.side_effect is not None:
+            outcome = next(self.side_effect)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+
+_API_URL = "http://localhost:4000/api/v1"
+
+
+def _mk_args(
+    *extra: str, file: Path | None = None, queue: bool = False, **flags: object
+) -> list[str]:
+    """Build jux-publish arguments against the test API URL.
+
+    Keyword flags become options (``dry_run=True`` -> ``--dry-run``,
+    ``storage_path=p`` -> ``--storage-path p``); positional ``extra``
+    arguments are appended verbatim.
+    """
+    args = ["--api-url", _API_URL]
+    if file is not None:
+        args += ["--file", str(file)]
+    if queue:
+        args.append("--queue")
+    for name, value in flags.items():
+        option = f"--{name.replace('_', '-')}"
+        args += [option] if value is True else [option, str(value)]
+    args += extra
+    return args
+
+
+class _MemStorage:
+    """In-memory stand-in for ReportStorage covering the calls jux-publish makes."""
+
+    def __init__(self) -> None:
+        self.queue: dict[str, bytes] = {}
+        self.reports: dict[str, bytes] = {}
+
+    def queue_report(self, xml_content: bytes, canonical_hash: str) -> None:
+        self.queue[canonical_hash] = xml_content
+
+    def get_queued_report(self, canonical_hash: str) -> bytes:
+        try:
+            return self.queue[canonical_hash]
+        except KeyError:
+            raise QueuedReportNotFoundError(canonical_hash) from None
+
+    def list_queued_reports(self) -> list[str]:
+        return list(self.queue)
+
+    def list_reports(self) -> list[str]:
+        return list(self.reports)
+
+    def dequeue_report(self, canonical_hash: str) -> None:
+        self.reports[canonical_hash] = self.queue.pop(canonical_hash)
 
 
 # Test fixtures
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def stub_client(monkeypatch: pytest.MonkeyPatch) -> _StubClient:
+    """Replace JuxAPIClient in the publish command with a recording stub."""
+    stub = _StubClient()
+    monkeypatch.setattr(publish_cmd, "JuxAPIClient", stub)
+    return stub
+
+
+@pytest.fixture(autouse=True)
+def default_storage_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the default queue storage path at the test's tmp_path."""
+    monkeypatch.setattr(publish_cmd, "get_default_storage_path", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
 def mock_publish_response() -> PublishResponse:
     """Create a mock successful publish response (jux-openapi SubmitResponse format)."""
     return PublishResponse(
@@ -30,7 +137,7 @@ def mock_publish_response() -> PublishResponse:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_xml_content() -> str:
     """Sample JUnit XML content for testing."""
     return """<?xml version="1.0" encoding="utf-8"?>
@@ -42,142 +149,140 @@ def sample_xml_content() -> str:
 """
 
 
-@pytest.fixture
-def sample_xml_file(tmp_path: Path, sample_xml_content: str) -> Path:
-    """Create a sample XML file for testing."""
-    xml_file = tmp_path / "report.xml"
+@pytest.fixture(scope="session")
+def sample_xml_bytes(sample_xml_content: str) -> bytes:
+    """Sample JUnit XML content encoded once for queue_report()."""
+    return sample_xml_content.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_xml_file(
+    tmp_path_factory: pytest.TempPathFactory, sample_xml_content: str
+) -> Path:
+    """Create a sample XML file shared by all tests (read-only)."""
+    xml_file = tmp_path_factory.mktemp("publish") / "report.xml"
     xml_file.write_text(sample_xml_content)
     return xml_file
 
 
-class TestPublishSingleFile:
-    """Tests for single file publishing."""
-
-    def test_publish_single_file_success(
-        self,
-        sample_xml_file: Path,
-        mock_publish_response: PublishResponse,
-        capsys: pytest.CaptureFixture,
-    ) -> None:
-        """Should successfully publish a single file."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                ]
+@pytest.fixture
+def make_queued_storage(
+    sample_xml_bytes: bytes, monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., _MemStorage | ReportStorage]:
+    """Factory for a storage pre-populated with ``n`` queued reports.
+
+    By default the reports are queued in an in-memory storage that the
+    publish command picks up in place of ReportStorage. Passing
+    ``storage_path`` uses the real filesystem-backed ReportStorage instead.
+    """
+
+    def _make(
+        n: int = 2, storage_path: Path | None = None
+    ) -> _MemStorage | ReportStorage:
+        storage: _MemStorage | ReportStorage
+        if storage_path is None:
+            storage = _MemStorage()
+            monkeypatch.setattr(
+                publish_cmd, "ReportStorage", lambda storage_path: storage
             )
+        else:
+            storage = ReportStorage(storage_path=storage_path)
+        for i in range(1, n + 1):
+            storage.queue_report(sample_xml_bytes, f"sha256:test{i}")
+        return storage
 
-        assert result == 0
-        mock_client.publish_report.assert_called_once()
-        captured = capsys.readouterr()
-        assert "published successfully" in captured.out.lower() or "✓" in captured.out
+    return _make
 
-    def test_publish_single_file_not_found(
-        self,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture,
-    ) -> None:
-        """Should fail when file doesn't exist."""
-        nonexistent = tmp_path / "nonexistent.xml"
-
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--file",
-                    str(nonexistent),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                ]
-            )
 
-        assert result == 1
-        captured = capsys.readouterr()
-        assert "not found" in captured.out.lower() or "failed" in captured.out.lower()
+def _outcomes(
+    names: tuple[str, ...], response: PublishResponse
+) -> Iterator[PublishResponse | Exception]:
+    """Map "ok"/"fail" outcome names to publish_report results."""
+    for name in names:
+        if name == "ok":
+            yield response
+        else:
+            yield requests.exceptions.HTTPError("500 Server Error")
 
-    def test_publish_single_file_api_error(
-        self,
-        sample_xml_file: Path,
-        capsys: pytest.CaptureFixture,
-    ) -> None:
-        """Should handle API errors gracefully."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.side_effect = requests.exceptions.HTTPError(
-                "401 Unauthorized"
-            )
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                ]
-            )
 
-        assert result == 1
-        captured = capsys.readouterr()
-        assert "failed" in captured.out.lower() or "✗" in captured.out
+def _contains_any(out: str, *needles: str) -> bool:
+    """Case-insensitively check captured output for any of the (lowercase) needles."""
+    low = out.lower()
+    return any(needle in low for needle in needles)
+
+
+def _snapshot(storage: _MemStorage | ReportStorage) -> tuple[int, int]:
+    """Return (queued, published) report counts for a storage."""
+    return len(storage.list_queued_reports()), len(storage.list_reports())
+
 
-    def test_publish_single_file_dry_run(
+class TestPublishSingleFile:
+    """Tests for single file publishing."""
+
+    @pytest.mark.parametrize(
+        ("extra_args", "outcome", "missing_file", "expected_rc", "calls", "needles"),
+        [
+            pytest.param(
+                [], "ok", False, 0, 1, ("published successfully", "✓"), id="success"
+            ),
+            pytest.param([], None, True, 1, 0, ("not found", "failed"), id="not_found"),
+            pytest.param([], "fail", False, 1, 1, ("failed", "✗"), id="api_error"),
+            pytest.param(
+                ["--dry-run"],
+                None,
+                False,
+                0,
+                0,
+                ("dry run", "would publish"),
+                id="dry_run",
+            ),
+            pytest.param(
+                ["--verbose"],
+                "ok",
+                False,
+                0,
+                1,
+                ("test run id: 550e8400-e29b-41d4-a716-446655440000",),
+                id="verbose",
+            ),
+        ],
+    )
+    def test_publish_single_file(
         self,
+        extra_args: list[str],
+        outcome: str | None,
+        missing_file: bool,
+        expected_rc: int,
+        calls: int,
+        needles: tuple[str, ...],
+        tmp_path: Path,
         sample_xml_file: Path,
+        mock_publish_response: PublishResponse,
+        stub_client: _StubClient,
         capsys: pytest.CaptureFixture,
     ) -> None:
-        """Should not actually publish in dry-run mode."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--dry-run",
-                ]
-            )
+        """Should publish a single file and report the outcome."""
+        xml_file = tmp_path / "nonexistent.xml" if missing_file else sample_xml_file
+        if outcome is not None:
+            stub_client.side_effect = _outcomes((outcome,), mock_publish_response)
 
-        assert result == 0
-        mock_client.publish_report.assert_not_called()
-        captured = capsys.readouterr()
-        assert (
-            "dry run" in captured.out.lower() or "would publish" in captured.out.lower()
-        )
+        result = main(_mk_args(*extra_args, file=xml_file))
+
+        assert result == expected_rc
+        assert stub_client.call_count == calls
+        assert _contains_any(capsys.readouterr().out, *needles)
 
     def test_publish_single_file_json_output(
         self,
         sample_xml_file: Path,
         mock_publish_response: PublishResponse,
+        stub_client: _StubClient,
         capsys: pytest.CaptureFixture,
     ) -> None:
         """Should output JSON when --json flag is used."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--json",
-                ]
-            )
+        stub_client.result = mock_publish_response
+
+        result = main(_mk_args(file=sample_xml_file, json=True))
 
         assert result == 0
         captured = capsys.readouterr()
@@ -186,238 +291,160 @@ class TestPublishSingleFile:
         assert data["published"] == 1
         assert len(data["results"]) == 1
 
-    def test_publish_single_file_verbose(
+    def test_publish_from_stdin(
         self,
-        sample_xml_file: Path,
+        sample_xml_content: str,
         mock_publish_response: PublishResponse,
-        capsys: pytest.CaptureFixture,
+        stub_client: _StubClient,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Should show detailed output in verbose mode."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--verbose",
-                ]
-            )
+        """Should publish the report read from stdin for ``--file -``."""
+        stub_client.result = mock_publish_response
+        monkeypatch.setattr(sys, "stdin", StringIO(sample_xml_content))
+
+        result = main(_mk_args(file=Path("-")))
 
         assert result == 0
-        captured = capsys.readouterr()
-        assert "Test run ID" in captured.out
-        assert mock_publish_response.test_run_id in captured.out
+        assert stub_client.calls == [((sample_xml_content,), {})]
 
 
-class TestPublishQueue:
-    """Tests for queue publishing."""
+class TestPublishCommand:
+    """Tests for the reusable PublishCommand runner."""
 
-    def test_publish_empty_queue(
+    @pytest.mark.parametrize(
+        ("outcomes", "expected_rc"),
+        [
+            pytest.param(("ok", "ok"), 0, id="all_ok"),
+            pytest.param(("fail", "fail"), 1, id="all_failed"),
+            pytest.param(("ok", "fail"), 2, id="partial"),
+        ],
+    )
+    def test_execute_reuses_one_client(
         self,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture,
+        outcomes: tuple[str, ...],
+        expected_rc: int,
+        sample_xml_file: Path,
+        mock_publish_response: PublishResponse,
+        stub_client: _StubClient,
     ) -> None:
-        """Should handle empty queue gracefully."""
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                    ]
-                )
+        """Should publish every file through a single client."""
+        stub_client.side_effect = _outcomes(outcomes, mock_publish_response)
 
-        assert result == 0
-        captured = capsys.readouterr()
-        assert "no reports" in captured.out.lower()
+        with PublishCommand(api_url=_API_URL) as command:
+            result = command.execute([sample_xml_file] * len(outcomes))
 
-    def test_publish_queue_success(
+        assert result == expected_rc
+        assert len(stub_client.init_kwargs) == 1
+        assert stub_client.call_count == len(outcomes)
+
+    def test_execute_json_output_is_one_document(
         self,
-        tmp_path: Path,
-        sample_xml_content: str,
+        sample_xml_file: Path,
         mock_publish_response: PublishResponse,
-        capsys: pytest.CaptureFixture,
+        stub_client: _StubClient,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
-        """Should successfully publish all queued reports."""
-        # Create storage and queue some reports
-        storage = ReportStorage(storage_path=tmp_path)
-        storage.queue_report(sample_xml_content.encode(), "sha256:test1")
-        storage.queue_report(sample_xml_content.encode(), "sha256:test2")
-
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.publish_report.return_value = mock_publish_response
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                    ]
-                )
+        """Should print a single JSON document summing every file's outcome."""
+        stub_client.side_effect = _outcomes(("ok", "fail", "ok"), mock_publish_response)
 
-        assert result == 0
-        assert mock_client.publish_report.call_count == 2
-        captured = capsys.readouterr()
-        assert "2" in captured.out  # Should mention 2 reports
+        with PublishCommand(api_url=_API_URL, json_output=True) as command:
+            result = command.execute([sample_xml_file] * 3)
 
-        # Verify reports were dequeued
-        assert len(storage.list_queued_reports()) == 0
-        assert len(storage.list_reports()) == 2
+        assert result == 2
+        data = json.loads(capsys.readouterr().out)
+        assert data["success"] is False
+        assert data["published"] == 2
+        assert data["failed"] == 1
+        assert [r["success"] for r in data["results"]] == [True, False, True]
 
-    def test_publish_queue_partial_failure(
-        self,
-        tmp_path: Path,
-        sample_xml_content: str,
-        mock_publish_response: PublishResponse,
-        capsys: pytest.CaptureFixture,
+    def test_execute_without_files_fails(
+        self, stub_client: _StubClient, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        """Should return exit code 2 on partial failure."""
-        # Create storage and queue some reports
-        storage = ReportStorage(storage_path=tmp_path)
-        storage.queue_report(sample_xml_content.encode(), "sha256:test1")
-        storage.queue_report(sample_xml_content.encode(), "sha256:test2")
-
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                # First call succeeds, second fails
-                mock_client.publish_report.side_effect = [
-                    mock_publish_response,
-                    requests.exceptions.HTTPError("500 Server Error"),
-                ]
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                    ]
-                )
-
-        assert result == 2  # Partial success
-        captured = capsys.readouterr()
-        assert "1" in captured.out  # Some reference to counts
+        """Should treat an empty file list as an error, not a success."""
+        with PublishCommand(api_url=_API_URL, json_output=True) as command:
+            result = command.execute([])
+
+        assert result == 1
+        assert stub_client.call_count == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data["success"] is False
+        assert data["published"] == 0
 
-    def test_publish_queue_all_fail(
+
+class TestPublishQueue:
+    """Tests for queue publishing."""
+
+    def test_publish_empty_queue(
         self,
-        tmp_path: Path,
-        sample_xml_content: str,
         capsys: pytest.CaptureFixture,
     ) -> None:
-        """Should return exit code 1 when all reports fail."""
-        # Create storage and queue some reports
-        storage = ReportStorage(storage_path=tmp_path)
-        storage.queue_report(sample_xml_content.encode(), "sha256:test1")
-        storage.queue_report(sample_xml_content.encode(), "sha256:test2")
-
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.publish_report.side_effect = requests.exceptions.HTTPError(
-                    "500 Server Error"
-                )
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                    ]
-                )
-
-        assert result == 1  # All failed
-        captured = capsys.readouterr()
-        assert "failed" in captured.out.lower()
+        """Should handle empty queue gracefully."""
+        result = main(_mk_args(queue=True))
 
-    def test_publish_queue_dry_run(
+        assert result == 0
+        assert _contains_any(capsys.readouterr().out, "no reports")
+
+    @pytest.mark.parametrize(
+        ("extra_args", "outcomes", "expected_rc", "remaining", "published", "needle"),
+        [
+            pytest.param(
+                [], ("ok", "ok"), 0, 0, 2, "all 2 report(s) published", id="success"
+            ),
+            pytest.param(
+                [],
+                ("ok", "fail"),
+                2,
+                1,
+                1,
+                "published 1, failed 1",
+                id="partial_failure",
+            ),
+            pytest.param(
+                [], ("fail", "fail"), 1, 2, 0, "all 2 report(s) failed", id="all_fail"
+            ),
+            pytest.param(["--dry-run"], (), 0, 2, 0, "would publish 2", id="dry_run"),
+        ],
+    )
+    def test_publish_queue(
         self,
-        tmp_path: Path,
-        sample_xml_content: str,
+        extra_args: list[str],
+        outcomes: tuple[str, ...],
+        expected_rc: int,
+        remaining: int,
+        published: int,
+        needle: str,
+        make_queued_storage: Callable[..., _MemStorage | ReportStorage],
+        mock_publish_response: PublishResponse,
+        stub_client: _StubClient,
         capsys: pytest.CaptureFixture,
     ) -> None:
-        """Should not actually publish in dry-run mode."""
-        # Create storage and queue some reports
-        storage = ReportStorage(storage_path=tmp_path)
-        storage.queue_report(sample_xml_content.encode(), "sha256:test1")
-        storage.queue_report(sample_xml_content.encode(), "sha256:test2")
-
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                        "--dry-run",
-                    ]
-                )
+        """Should publish queued reports and dequeue the successful ones."""
+        storage = make_queued_storage(2)
 
-        assert result == 0
-        mock_client.publish_report.assert_not_called()
-        # Reports should still be in queue
-        assert len(storage.list_queued_reports()) == 2
+        stub_client.side_effect = _outcomes(outcomes, mock_publish_response)
+
+        result = main(_mk_args(*extra_args, queue=True))
+
+        assert result == expected_rc
+        assert stub_client.call_count == len(outcomes)
+        assert _contains_any(capsys.readouterr().out, needle)
+
+        # Failed and dry-run reports stay queued
+        assert _snapshot(storage) == (remaining, published)
 
     def test_publish_queue_json_output(
         self,
-        tmp_path: Path,
-        sample_xml_content: str,
+        make_queued_storage: Callable[..., _MemStorage | ReportStorage],
         mock_publish_response: PublishResponse,
+        stub_client: _StubClient,
         capsys: pytest.CaptureFixture,
     ) -> None:
         """Should output JSON when --json flag is used."""
-        # Create storage and queue a report
-        storage = ReportStorage(storage_path=tmp_path)
-        storage.queue_report(sample_xml_content.encode(), "sha256:test1")
-
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.publish_report.return_value = mock_publish_response
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                        "--json",
-                    ]
-                )
+        make_queued_storage(1)
+
+        stub_client.result = mock_publish_response
+
+        result = main(_mk_args(queue=True, json=True))
 
         assert result == 0
         captured = capsys.readouterr()
@@ -430,150 +457,76 @@ class TestPublishQueue:
     def test_publish_queue_with_custom_storage_path(
         self,
         tmp_path: Path,
-        sample_xml_content: str,
+        make_queued_storage: Callable[..., _MemStorage | ReportStorage],
         mock_publish_response: PublishResponse,
-        capsys: pytest.CaptureFixture,
+        stub_client: _StubClient,
     ) -> None:
         """Should use custom storage path when provided."""
         custom_path = tmp_path / "custom"
-        storage = ReportStorage(storage_path=custom_path)
-        storage.queue_report(sample_xml_content.encode(), "sha256:test1")
-
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            result = main(
-                [
-                    "--queue",
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--storage-path",
-                    str(custom_path),
-                ]
-            )
+        make_queued_storage(1, storage_path=custom_path)
+
+        stub_client.result = mock_publish_response
+
+        result = main(_mk_args(queue=True, storage_path=custom_path))
 
         assert result == 0
-        mock_client.publish_report.assert_called_once()
+        assert stub_client.call_count == 1
 
 
 class TestPublishConfiguration:
     """Tests for configuration options."""
 
-    def test_bearer_token_passed_to_client(
-        self,
-        sample_xml_file: Path,
-        mock_publish_response: PublishResponse,
-    ) -> None:
-        """Should pass bearer token to API client."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--bearer-token",
-                    "test-token",  # noqa: S106 - Test token
-                ]
-            )
-
-        mock_client_class.assert_called_once()
-        call_kwargs = mock_client_class.call_args[1]
-        assert call_kwargs["bearer_token"] == "test-token"  # noqa: S105 - Test token
-
-    def test_timeout_passed_to_client(
+    @pytest.mark.parametrize(
+        ("flag", "value", "kwarg_name", "expected"),
+        [
+            pytest.param(
+                "--bearer-token",
+                "test-token",  # noqa: S106 - Test token
+                "bearer_token",
+                "test-token",  # noqa: S106 - Test token
+                id="bearer_token",
+            ),
+            pytest.param("--timeout", "60", "timeout", 60, id="timeout"),
+            pytest.param("--max-retries", "5", "max_retries", 5, id="max_retries"),
+        ],
+    )
+    def test_option_passed_to_client(
         self,
+        flag: str,
+        value: str,
+        kwarg_name: str,
+        expected: object,
         sample_xml_file: Path,
         mock_publish_response: PublishResponse,
+        stub_client: _StubClient,
     ) -> None:
-        """Should pass timeout to API client."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--timeout",
-                    "60",
-                ]
-            )
+        """Should pass API options through to the API client."""
+        stub_client.result = mock_publish_response
 
-        mock_client_class.assert_called_once()
-        call_kwargs = mock_client_class.call_args[1]
-        assert call_kwargs["timeout"] == 60
-
-    def test_max_retries_passed_to_client(
-        self,
-        sample_xml_file: Path,
-        mock_publish_response: PublishResponse,
-    ) -> None:
-        """Should pass max_retries to API client."""
-        with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.publish_report.return_value = mock_publish_response
-            mock_client_class.return_value = mock_client
-
-            main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                    "--max-retries",
-                    "5",
-                ]
-            )
+        main(_mk_args(flag, value, file=sample_xml_file))
 
-        mock_client_class.assert_called_once()
-        call_kwargs = mock_client_class.call_args[1]
-        assert call_kwargs["max_retries"] == 5
+        assert len(stub_client.init_kwargs) == 1
+        assert stub_client.init_kwargs[0][kwarg_name] == expected
 
 
 class TestPublishArgParsing:
     """Tests for argument parsing."""
 
-    def test_requires_file_or_queue(self, capsys: pytest.CaptureFixture) -> None:
+    def test_requires_file_or_queue(self) -> None:
         """Should require either --file or --queue."""
         with pytest.raises(SystemExit) as exc_info:
-            main(["--api-url", "http://localhost:4000/api/v1"])
+            main(_mk_args())
 
         assert exc_info.value.code != 0
 
-    def test_file_and_queue_mutually_exclusive(
-        self,
-        sample_xml_file: Path,
-        capsys: pytest.CaptureFixture,
-    ) -> None:
+    def test_file_and_queue_mutually_exclusive(self, sample_xml_file: Path) -> None:
         """Should not allow both --file and --queue."""
         with pytest.raises(SystemExit) as exc_info:
-            main(
-                [
-                    "--file",
-                    str(sample_xml_file),
-                    "--queue",
-                    "--api-url",
-                    "http://localhost:4000/api/v1",
-                ]
-            )
+            main(_mk_args(file=sample_xml_file, queue=True))
 
         assert exc_info.value.code != 0
 
-    def test_requires_api_url(
-        self,
-        sample_xml_file: Path,
-        capsys: pytest.CaptureFixture,
-    ) -> None:
+    def test_requires_api_url(self, sample_xml_file: Path) -> None:
         """Should require --api-url."""
         with pytest.raises(SystemExit) as exc_info:
             main(["--file", str(sample_xml_file)])
@@ -586,26 +539,10 @@ class TestPublishEmptyQueueJson:
 
     def test_empty_queue_json_output(
         self,
-        tmp_path: Path,
         capsys: pytest.CaptureFixture,
     ) -> None:
         """Should return proper JSON for empty queue."""
-        with patch(
-            "pytest_jux.commands.publish.get_default_storage_path",
-            return_value=tmp_path,
-        ):
-            with patch("pytest_jux.commands.publish.JuxAPIClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client_class.return_value = mock_client
-
-                result = main(
-                    [
-                        "--queue",
-                        "--api-url",
-                        "http://localhost:4000/api/v1",
-                        "--json",
-                    ]
-                )
+        result = main(_mk_args(queue=True, json=True))
 
         assert result == 0
         captured = capsys.readouterr()
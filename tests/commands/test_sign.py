@@ -3,373 +3,245 @@
 
 """Tests for jux-sign command."""
 
-from io import StringIO
+import argparse
+import os
+import sys
+from io import BytesIO, StringIO
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
+from conftest import KEYS_DIR
 from lxml import etree
 
 from pytest_jux.commands.sign import main
 
-
-@pytest.fixture
-def test_xml(tmp_path: Path) -> Path:
-    """Create a test JUnit XML file."""
-    xml_path = tmp_path / "test.xml"
-    xml_content = """<?xml version="1.0" encoding="utf-8"?>
+_BASE_XML = b"""<?xml version="1.0" encoding="utf-8"?>
 <testsuites>
     <testsuite name="test_suite" tests="1" failures="0" errors="0">
         <testcase classname="test_module" name="test_example" time="0.001"/>
     </testsuite>
 </testsuites>
 """
-    xml_path.write_text(xml_content)
-    return xml_path
 
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
 
-@pytest.fixture
-def test_key(tmp_path: Path) -> Path:
-    """Create a test RSA key."""
-    from pytest_jux.commands.keygen import generate_rsa_key, save_key
 
-    key = generate_rsa_key(2048)
-    key_path = tmp_path / "test_key.pem"
-    save_key(key, key_path)
-    return key_path
+@pytest.fixture(scope="session")
+def test_xml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a test JUnit XML file (shared read-only across the session)."""
+    xml_path = tmp_path_factory.mktemp("xml") / "test.xml"
+    xml_path.write_bytes(_BASE_XML)
+    return xml_path
 
 
-@pytest.fixture
-def test_cert(tmp_path: Path, test_key: Path) -> Path:
-    """Create a test certificate."""
-    from pytest_jux.commands.keygen import generate_self_signed_cert
-    from pytest_jux.signer import load_private_key
+@pytest.fixture(scope="session")
+def test_key() -> Path:
+    """Pre-generated RSA 2048-bit test key from tests/fixtures/keys."""
+    return KEYS_DIR / "rsa_2048.pem"
+
+
+@pytest.fixture(scope="session")
+def ecdsa_key() -> Path:
+    """Pre-generated ECDSA P-256 test key from tests/fixtures/keys."""
+    return KEYS_DIR / "ecdsa_p256.pem"
+
+
+@pytest.fixture(scope="session")
+def test_cert() -> Path:
+    """Pre-generated self-signed certificate matching ``test_key``."""
+    return KEYS_DIR / "rsa_2048.crt"
+
+
+@pytest.fixture(scope="module")
+def signed_outputs(
+    tmp_path_factory: pytest.TempPathFactory,
+    test_xml: Path,
+    test_key: Path,
+    test_cert: Path,
+) -> dict[str, bytes]:
+    """Run each positive-path jux-sign invocation once and share the output.
+
+    Returns:
+        Mapping of invocation name to the signed XML bytes it produced
+    """
+    work_dir = tmp_path_factory.mktemp("signed")
+    config_path = work_dir / "jux.conf"
+    config_path.write_text(f"key={test_key}\n")
+    existing_path = work_dir / "existing.xml"
+    existing_path.write_text("existing content")
+
+    key_args = ["--key", str(test_key)]
+    file_invocations = {
+        "basic": (["--input", str(test_xml), *key_args], work_dir / "basic.xml"),
+        "with_cert": (
+            ["--input", str(test_xml), *key_args, "--cert", str(test_cert)],
+            work_dir / "with_cert.xml",
+        ),
+        "from_stdin": (key_args, work_dir / "from_stdin.xml"),
+        "config_file": (
+            ["--config", str(config_path), "--input", str(test_xml)],
+            work_dir / "config_file.xml",
+        ),
+        "overwrites": (["--input", str(test_xml), *key_args], existing_path),
+    }
+    stdout_invocations = {
+        "stdout": ["--input", str(test_xml), *key_args],
+        "stdin_to_stdout": key_args,
+    }
+
+    outputs: dict[str, bytes] = {}
+    for name, (args, output_path) in file_invocations.items():
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(sys, "argv", ["jux-sign", *args, "--output", str(output_path)])
+            mp.setattr(sys, "stdin", StringIO(_BASE_XML.decode("utf-8")))
+            assert main() == 0
+        outputs[name] = output_path.read_bytes()
+
+    for name, args in stdout_invocations.items():
+        captured_output = BytesIO()
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(sys, "argv", ["jux-sign", *args])
+            mp.setattr(sys, "stdin", StringIO(_BASE_XML.decode("utf-8")))
+            mp.setattr(sys, "stdout", SimpleNamespace(buffer=captured_output))
+            assert main() == 0
+        outputs[name] = captured_output.getvalue()
 
-    key = load_private_key(test_key)
-    cert_path = tmp_path / "test_cert.crt"
-    generate_self_signed_cert(key, cert_path)
-    return cert_path
+    return outputs
 
 
 class TestSignCommand:
     """Tests for jux-sign command."""
 
-    def test_signs_xml_file(
-        self, test_xml: Path, test_key: Path, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("invocation", "expected"),
+        [
+            ("basic", [b"Signature"]),
+            ("with_cert", [b"Signature", b"X509Certificate"]),
+            ("from_stdin", [b"Signature"]),
+            ("stdout", [b"<?xml", b"Signature"]),
+            ("stdin_to_stdout", [b"Signature"]),
+            ("config_file", [b"Signature"]),
+        ],
+    )
+    def test_signs_xml(
+        self,
+        signed_outputs: dict[str, bytes],
+        invocation: str,
+        expected: list[bytes],
     ) -> None:
-        """Test signing XML file with RSA key."""
-        output_path = tmp_path / "signed.xml"
+        """Test that each input/output/key combination produces a signed report."""
+        signed_content = signed_outputs[invocation]
 
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(test_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(test_key),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code == 0
-        assert output_path.exists()
+        for fragment in expected:
+            assert fragment in signed_content
 
-        # Verify signature is present
-        signed_content = output_path.read_text()
-        assert "Signature" in signed_content
-
-    def test_signs_with_certificate(
-        self, test_xml: Path, test_key: Path, test_cert: Path, tmp_path: Path
-    ) -> None:
-        """Test signing XML with key and certificate."""
-        output_path = tmp_path / "signed.xml"
-
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(test_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(test_key),
-                "--cert",
-                str(test_cert),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code == 0
-        signed_content = output_path.read_text()
-        assert "Signature" in signed_content
-        assert "X509Certificate" in signed_content
-
-    def test_preserves_xml_content(
-        self, test_xml: Path, test_key: Path, tmp_path: Path
-    ) -> None:
+    def test_preserves_xml_content(self, signed_outputs: dict[str, bytes]) -> None:
         """Test that signing preserves original XML content."""
-        output_path = tmp_path / "signed.xml"
-
         # Read original testcase name
-        original_tree = etree.parse(str(test_xml))
-        original_testcase = original_tree.find(".//testcase")
+        original_tree = etree.fromstring(_BASE_XML, _PARSER)
+        original_testcase = next(original_tree.iter("testcase"), None)
         assert original_testcase is not None
         original_name = original_testcase.get("name")
 
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(test_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(test_key),
-            ],
-        ):
-            main()
-
         # Verify content preserved
-        signed_tree = etree.parse(str(output_path))
-        signed_testcase = signed_tree.find(".//testcase")
+        signed_tree = etree.fromstring(signed_outputs["basic"], _PARSER)
+        signed_testcase = next(signed_tree.iter("testcase"), None)
         assert signed_testcase is not None
         assert signed_testcase.get("name") == original_name
 
-    def test_writes_to_stdout(self, test_xml: Path, test_key: Path) -> None:
-        """Test writing signed XML to stdout."""
-        from io import BytesIO
-        from unittest.mock import Mock
-
-        captured_output = BytesIO()
-        mock_stdout = Mock()
-        mock_stdout.buffer = captured_output
-
-        with patch(
-            "sys.argv", ["jux-sign", "--input", str(test_xml), "--key", str(test_key)]
-        ):
-            with patch("sys.stdout", mock_stdout):
-                exit_code = main()
+    def test_overwrites_existing_output(self, signed_outputs: dict[str, bytes]) -> None:
+        """Test that existing output file is overwritten."""
+        signed_content = signed_outputs["overwrites"]
 
-        assert exit_code == 0
-        output = captured_output.getvalue().decode("utf-8")
-        assert "Signature" in output
-        assert "<?xml" in output
+        assert b"existing content" not in signed_content
+        assert b"Signature" in signed_content
 
-    def test_reads_from_stdin(
-        self, test_xml: Path, test_key: Path, tmp_path: Path
+    def test_requires_key_path(
+        self, test_xml: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test reading XML from stdin."""
-        output_path = tmp_path / "signed.xml"
-        xml_content = test_xml.read_text()
-
-        with patch(
-            "sys.argv",
-            ["jux-sign", "--output", str(output_path), "--key", str(test_key)],
-        ):
-            with patch("sys.stdin", StringIO(xml_content)):
-                exit_code = main()
-
-        assert exit_code == 0
-        assert output_path.exists()
-        signed_content = output_path.read_text()
-        assert "Signature" in signed_content
-
-    def test_stdin_to_stdout(self, test_xml: Path, test_key: Path) -> None:
-        """Test reading from stdin and writing to stdout (pipeline mode)."""
-        from io import BytesIO
-        from unittest.mock import Mock
-
-        xml_content = test_xml.read_text()
-        captured_output = BytesIO()
-        mock_stdout = Mock()
-        mock_stdout.buffer = captured_output
-
-        with patch("sys.argv", ["jux-sign", "--key", str(test_key)]):
-            with patch("sys.stdin", StringIO(xml_content)):
-                with patch("sys.stdout", mock_stdout):
-                    exit_code = main()
-
-        assert exit_code == 0
-        output = captured_output.getvalue().decode("utf-8")
-        assert "Signature" in output
-
-    def test_requires_key_path(self, test_xml: Path) -> None:
         """Test that key path is required."""
-        with patch("sys.argv", ["jux-sign", "--input", str(test_xml)]):
-            with pytest.raises(SystemExit):
-                main()
-
-    def test_validates_key_file_exists(self, test_xml: Path, tmp_path: Path) -> None:
-        """Test that key file existence is validated."""
-        output_path = tmp_path / "signed.xml"
-        nonexistent_key = tmp_path / "nonexistent.pem"
-
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(test_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(nonexistent_key),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code != 0  # Should fail
-
-    def test_validates_input_file_exists(self, test_key: Path, tmp_path: Path) -> None:
-        """Test that input file existence is validated."""
-        output_path = tmp_path / "signed.xml"
-        nonexistent_xml = tmp_path / "nonexistent.xml"
-
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(nonexistent_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(test_key),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code != 0
-
-    def test_handles_invalid_xml(self, test_key: Path, tmp_path: Path) -> None:
-        """Test handling of invalid XML input."""
-        invalid_xml = tmp_path / "invalid.xml"
-        invalid_xml.write_text("not valid xml content")
-        output_path = tmp_path / "signed.xml"
-
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(invalid_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(test_key),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code != 0
-
-    def test_handles_invalid_key(self, test_xml: Path, tmp_path: Path) -> None:
-        """Test handling of invalid key file."""
-        invalid_key = tmp_path / "invalid_key.pem"
-        invalid_key.write_text("not a valid key")
-        output_path = tmp_path / "signed.xml"
+        monkeypatch.setattr(sys, "argv", ["jux-sign", "--input", str(test_xml)])
+        with pytest.raises(SystemExit):
+            main()
 
-        with patch(
-            "sys.argv",
+    @pytest.mark.parametrize(
+        ("xml_content", "key"),
+        [
+            pytest.param(_BASE_XML, None, id="nonexistent_key"),
+            pytest.param(None, KEYS_DIR / "rsa_2048.pem", id="nonexistent_xml"),
+            pytest.param(
+                b"not valid xml content", KEYS_DIR / "rsa_2048.pem", id="invalid_xml"
+            ),
+            pytest.param(_BASE_XML, "not a valid key", id="invalid_key"),
+        ],
+    )
+    def test_rejects_bad_input(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        xml_content: bytes | None,
+        key: Path | str | None,
+    ) -> None:
+        """Test that a missing or malformed input or key file fails cleanly.
+
+        ``None`` leaves the file missing, a string is written as its content,
+        and a Path points at an existing key.
+        """
+        xml_path = tmp_path / "input.xml"
+        if xml_content is not None:
+            xml_path.write_bytes(xml_content)
+
+        if isinstance(key, Path):
+            key_path = key
+        else:
+            key_path = tmp_path / "key.pem"
+            if key is not None:
+                key_path.write_text(key)
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
             [
                 "jux-sign",
                 "--input",
-                str(test_xml),
+                str(xml_path),
                 "--output",
-                str(output_path),
+                str(tmp_path / "signed.xml"),
                 "--key",
-                str(invalid_key),
+                str(key_path),
             ],
-        ):
-            exit_code = main()
+        )
+        exit_code = main()
 
         assert exit_code != 0
 
-    def test_displays_help_text(self) -> None:
+    def test_displays_help_text(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that help text is displayed."""
-        with patch("sys.argv", ["jux-sign", "--help"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 0
-
-    def test_supports_config_file(
-        self, test_xml: Path, test_key: Path, tmp_path: Path
-    ) -> None:
-        """Test that config file is supported."""
-        config_path = tmp_path / "jux.conf"
-        config_path.write_text(f"key={test_key}\n")
-        output_path = tmp_path / "signed.xml"
-
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--config",
-                str(config_path),
-                "--input",
-                str(test_xml),
-                "--output",
-                str(output_path),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code == 0
-        assert output_path.exists()
-
-    def test_overwrites_existing_output(
-        self, test_xml: Path, test_key: Path, tmp_path: Path
-    ) -> None:
-        """Test that existing output file is overwritten."""
-        output_path = tmp_path / "signed.xml"
-        output_path.write_text("existing content")
-
-        with patch(
-            "sys.argv",
-            [
-                "jux-sign",
-                "--input",
-                str(test_xml),
-                "--output",
-                str(output_path),
-                "--key",
-                str(test_key),
-            ],
-        ):
-            exit_code = main()
-
-        assert exit_code == 0
-        signed_content = output_path.read_text()
-        assert "existing content" not in signed_content
-        assert "Signature" in signed_content
+        # Only the exit status matters here, not the rendered help text
+        monkeypatch.setattr(argparse.HelpFormatter, "format_help", lambda self: "")
+        monkeypatch.setattr(sys, "argv", ["jux-sign", "--help"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
 
 
 class TestSigningWithECDSA:
     """Tests for signing with ECDSA keys."""
 
-    @pytest.fixture
-    def ecdsa_key(self, tmp_path: Path) -> Path:
-        """Create a test ECDSA key."""
-        from pytest_jux.commands.keygen import generate_ecdsa_key, save_key
-
-        key = generate_ecdsa_key("P-256")
-        key_path = tmp_path / "ecdsa_key.pem"
-        save_key(key, key_path)
-        return key_path
-
     def test_signs_with_ecdsa_key(
-        self, test_xml: Path, ecdsa_key: Path, tmp_path: Path
+        self,
+        test_xml: Path,
+        ecdsa_key: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test signing with ECDSA key."""
         output_path = tmp_path / "signed.xml"
 
-        with patch(
-            "sys.argv",
+        monkeypatch.setattr(
+            sys,
+            "argv",
             [
                 "jux-sign",
                 "--input",
@@ -379,8 +251,8 @@ class TestSigningWithECDSA:
                 "--key",
                 str(ecdsa_key),
             ],
-        ):
-            exit_code = main()
+        )
+        exit_code = main()
 
         assert exit_code == 0
         signed_content = output_path.read_text()
@@ -390,29 +262,33 @@ class TestSigningWithECDSA:
 class TestEdgeCases:
     """Tests for edge cases and error conditions."""
 
-    def test_handles_large_xml_file(self, test_key: Path, tmp_path: Path) -> None:
+    @pytest.mark.slow
+    def test_handles_large_xml_file(
+        self, test_key: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling of large XML file."""
         large_xml = tmp_path / "large.xml"
 
         # Generate large XML with many test cases
-        testcases = "\n".join(
-            [
-                f'<testcase classname="test_module" name="test_{i}" time="0.001"/>'
-                for i in range(1000)
-            ]
+        count = 50
+        root = etree.Element("testsuites")
+        testsuite = etree.SubElement(
+            root,
+            "testsuite",
+            name="test_suite",
+            tests=str(count),
+            failures="0",
+            errors="0",
         )
-        xml_content = f"""<?xml version="1.0" encoding="utf-8"?>
-<testsuites>
-    <testsuite name="test_suite" tests="1000" failures="0" errors="0">
-        {testcases}
-    </testsuite>
-</testsuites>
-"""
-        large_xml.write_text(xml_content)
+        testcase_attrib = {"classname": "test_module", "time": "0.001"}
+        for i in range(count):
+            etree.SubElement(testsuite, "testcase", testcase_attrib, name=f"test_{i}")
+        etree.ElementTree(root).write(large_xml, xml_declaration=True, encoding="utf-8")
         output_path = tmp_path / "signed.xml"
 
-        with patch(
-            "sys.argv",
+        monkeypatch.setattr(
+            sys,
+            "argv",
             [
                 "jux-sign",
                 "--input",
@@ -422,13 +298,15 @@ class TestEdgeCases:
                 "--key",
                 str(test_key),
             ],
-        ):
-            exit_code = main()
+        )
+        exit_code = main()
 
         assert exit_code == 0
         assert output_path.exists()
 
-    def test_handles_xml_with_namespaces(self, test_key: Path, tmp_path: Path) -> None:
+    def test_handles_xml_with_namespaces(
+        self, test_key: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling of XML with namespaces."""
         namespaced_xml = tmp_path / "namespaced.xml"
         xml_content = """<?xml version="1.0" encoding="utf-8"?>
@@ -441,8 +319,9 @@ class TestEdgeCases:
         namespaced_xml.write_text(xml_content)
         output_path = tmp_path / "signed.xml"
 
-        with patch(
-            "sys.argv",
+        monkeypatch.setattr(
+            sys,
+            "argv",
             [
                 "jux-sign",
                 "--input",
@@ -452,22 +331,35 @@ class TestEdgeCases:
                 "--key",
                 str(test_key),
             ],
-        ):
-            exit_code = main()
+        )
+        exit_code = main()
 
         assert exit_code == 0
 
+    @pytest.mark.skipif(
+        sys.platform == "win32" or os.geteuid() == 0,
+        reason="chmod 0o444 does not block writes on Windows or as root",
+    )
     def test_handles_permission_error(
-        self, test_xml: Path, test_key: Path, tmp_path: Path
+        self,
+        test_xml: Path,
+        test_key: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test handling of permission errors."""
+        """Test that an unwritable output fails before any signing work."""
         readonly_dir = tmp_path / "readonly"
         readonly_dir.mkdir()
         readonly_dir.chmod(0o444)
         output_path = readonly_dir / "signed.xml"
+        monkeypatch.setattr(
+            "pytest_jux.commands.sign.sign_xml",
+            lambda *args: pytest.fail("signed before validating the output path"),
+        )
 
-        with patch(
-            "sys.argv",
+        monkeypatch.setattr(
+            sys,
+            "argv",
             [
                 "jux-sign",
                 "--input",
@@ -477,7 +369,7 @@ class TestEdgeCases:
                 "--key",
                 str(test_key),
             ],
-        ):
-            exit_code = main()
+        )
+        exit_code = main()
 
         assert exit_code != 0
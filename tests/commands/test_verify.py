@@ -1,53 +1,53 @@
 # SPDX-FileCopyrightText: 2025 Georges Martin <jrjsmrtn@gmail.com>
 # SPDX-License-Identifier: Apache-2.0
 
-"""Tests for jux-verify command."""
+"""Tests for jux-verify command.
 
-import sys
-from io import StringIO
+Tests sharing the session-scoped ECDSA ``signed_xml`` fixture form one
+xdist group, so the fixture is built on a single worker.
+"""
+
+import copy
+from collections.abc import Callable
+from io import BytesIO
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from conftest import KeyPair
 from lxml import etree
 
 from pytest_jux.canonicalizer import load_xml
-from pytest_jux.commands.keygen import (
-    generate_ecdsa_key,
-    generate_rsa_key,
-    generate_self_signed_cert,
-    save_key,
-)
-from pytest_jux.commands.verify import main
+from pytest_jux.commands.verify import main, verify_file
 from pytest_jux.signer import sign_xml
 
+pytestmark = pytest.mark.xdist_group("verify_ecdsa")
 
-@pytest.fixture
-def signed_xml(tmp_path: Path) -> tuple[Path, Path]:
-    """Create a signed XML file with certificate."""
-    # Create test XML
-    xml_content = """<?xml version="1.0"?>
+_TESTCASE_XPATH = etree.XPath("//testcase")
+
+_UNSIGNED_XML = """<?xml version="1.0"?>
 <testsuites>
     <testsuite name="test" tests="1">
         <testcase name="test_example"/>
     </testsuite>
 </testsuites>
 """
-    xml_path = tmp_path / "test.xml"
-    xml_path.write_text(xml_content)
 
-    # Generate key and certificate
-    key = generate_rsa_key(2048)
-    key_path = tmp_path / "key.pem"
-    save_key(key, key_path)
 
-    cert_path = tmp_path / "cert.crt"
-    generate_self_signed_cert(key, cert_path)
-    cert = cert_path.read_bytes()
+@pytest.fixture(scope="session")
+def signed_xml(
+    tmp_path_factory: pytest.TempPathFactory, ecdsa_keypair: KeyPair
+) -> tuple[Path, Path]:
+    """Create a signed XML file with certificate (shared read-only)."""
+    tmp_path = tmp_path_factory.mktemp("signed_xml")
+
+    # Create test XML
+    xml_path = tmp_path / "test.xml"
+    xml_path.write_text(_UNSIGNED_XML)
 
     # Sign XML
     tree = load_xml(xml_path)
-    signed_tree = sign_xml(tree, key, cert)
+    signed_tree = sign_xml(tree, ecdsa_keypair.key, ecdsa_keypair.cert_bytes)
 
     # Save signed XML
     signed_path = tmp_path / "signed.xml"
@@ -55,88 +55,87 @@ def signed_xml(tmp_path: Path) -> tuple[Path, Path]:
         etree.tostring(signed_tree, xml_declaration=True, encoding="utf-8")
     )
 
-    return signed_path, cert_path
+    return signed_path, ecdsa_keypair.cert_path
+
+
+@pytest.fixture(scope="session")
+def signed_xml_bytes(signed_xml: tuple[Path, Path]) -> bytes:
+    """Signed XML document from ``signed_xml``, read once."""
+    return signed_xml[0].read_bytes()
+
+
+@pytest.fixture(scope="session")
+def signed_tree_factory(signed_xml_bytes: bytes) -> Callable[[], etree._Element]:
+    """Return a factory of mutable copies of the signed XML, parsed once."""
+    root = etree.fromstring(signed_xml_bytes)
+    return lambda: copy.deepcopy(root)
+
+
+@pytest.fixture(scope="session")
+def tampered_signed_xml(
+    tmp_path_factory: pytest.TempPathFactory,
+    signed_tree_factory: Callable[[], etree._Element],
+) -> Path:
+    """Signed XML with one testcase renamed after signing (shared read-only)."""
+    tree = signed_tree_factory()
+    _TESTCASE_XPATH(tree)[0].set("name", "tampered_test")
+
+    tampered_path = tmp_path_factory.mktemp("tampered_xml") / "tampered.xml"
+    tampered_path.write_bytes(
+        etree.tostring(tree, xml_declaration=True, encoding="utf-8")
+    )
+    return tampered_path
 
 
 class TestVerifyCommand:
-    """Tests for jux-verify CLI command."""
+    """Tests for jux-verify command."""
 
     def test_verifies_valid_signature(self, signed_xml: tuple[Path, Path]) -> None:
         """Test verification of valid signature."""
         signed_path, cert_path = signed_xml
 
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(signed_path), "--cert", str(cert_path)],
-        ):
-            exit_code = main()
+        exit_code = verify_file(signed_path, cert_path)
 
         assert exit_code == 0
 
-    def test_verifies_from_stdin(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test verification from stdin."""
+    def test_cli_argparse_smoke(self, signed_xml: tuple[Path, Path]) -> None:
+        """Test that the CLI entry point parses arguments and verifies."""
         signed_path, cert_path = signed_xml
-        signed_content = signed_path.read_text()
 
-        mock_stdin = StringIO(signed_content)
+        exit_code = main(["-i", str(signed_path), "--cert", str(cert_path), "-q"])
 
-        with (
-            patch.object(sys, "argv", ["jux-verify", "--cert", str(cert_path)]),
-            patch("sys.stdin", mock_stdin),
-        ):
-            exit_code = main()
+        assert exit_code == 0
+
+    def test_verifies_from_stdin(
+        self, signed_xml: tuple[Path, Path], signed_xml_bytes: bytes
+    ) -> None:
+        """Test verification from stdin."""
+        _, cert_path = signed_xml
+
+        mock_stdin = BytesIO(signed_xml_bytes)
+
+        exit_code = verify_file(None, cert_path, stdin=mock_stdin)
 
         assert exit_code == 0
 
     def test_fails_for_tampered_xml(
-        self, signed_xml: tuple[Path, Path], tmp_path: Path
+        self,
+        signed_xml: tuple[Path, Path],
+        tampered_signed_xml: Path,
     ) -> None:
         """Test verification fails for tampered XML."""
-        signed_path, cert_path = signed_xml
-
-        # Tamper with the signed XML
-        tree = load_xml(signed_path)
-        testcase = tree.find(".//testcase")
-        assert testcase is not None
-        testcase.set("name", "tampered_test")
+        _, cert_path = signed_xml
 
-        tampered_path = tmp_path / "tampered.xml"
-        tampered_path.write_bytes(
-            etree.tostring(tree, xml_declaration=True, encoding="utf-8")
-        )
-
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(tampered_path), "--cert", str(cert_path)],
-        ):
-            exit_code = main()
+        exit_code = verify_file(tampered_signed_xml, cert_path)
 
         assert exit_code == 1
 
-    def test_fails_for_unsigned_xml(self, tmp_path: Path) -> None:
+    def test_fails_for_unsigned_xml(self, ecdsa_keypair: KeyPair) -> None:
         """Test verification fails for unsigned XML."""
-        # Create unsigned XML
-        xml_content = """<?xml version="1.0"?>
-<testsuites>
-    <testsuite name="test" tests="1">
-        <testcase name="test_example"/>
-    </testsuite>
-</testsuites>
-"""
-        xml_path = tmp_path / "unsigned.xml"
-        xml_path.write_text(xml_content)
+        # Unsigned XML is fed from memory; no file semantics are under test
+        mock_stdin = BytesIO(_UNSIGNED_XML.encode("utf-8"))
 
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        with patch.object(
-            sys, "argv", ["jux-verify", "-i", str(xml_path), "--cert", str(cert_path)]
-        ):
-            exit_code = main()
+        exit_code = verify_file(None, ecdsa_keypair.cert_path, stdin=mock_stdin)
 
         assert exit_code == 1
 
@@ -144,12 +143,7 @@ class TestVerifyCommand:
         """Test error handling for missing input file."""
         _, cert_path = signed_xml
 
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", "/nonexistent.xml", "--cert", str(cert_path)],
-        ):
-            exit_code = main()
+        exit_code = verify_file(Path("/nonexistent.xml"), cert_path)
 
         assert exit_code == 1
 
@@ -159,38 +153,23 @@ class TestVerifyCommand:
         """Test error handling for missing certificate file."""
         signed_path, _ = signed_xml
 
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(signed_path), "--cert", "/nonexistent.crt"],
-        ):
-            exit_code = main()
+        exit_code = verify_file(signed_path, Path("/nonexistent.crt"))
 
         assert exit_code == 1
 
-    def test_quiet_mode_with_stdout(self, signed_xml: tuple[Path, Path]) -> None:
+    def test_quiet_mode_with_stdout(
+        self, signed_xml: tuple[Path, Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test quiet mode when outputting to stdout."""
         signed_path, cert_path = signed_xml
 
-        # Capture stdout and stderr
-        captured_stdout = StringIO()
-        captured_stderr = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "-i", str(signed_path), "--cert", str(cert_path), "-q"],
-            ),
-            patch("sys.stdout", captured_stdout),
-            patch("sys.stderr", captured_stderr),
-        ):
-            exit_code = main()
+        exit_code = verify_file(signed_path, cert_path, quiet=True)
 
         assert exit_code == 0
         # Quiet mode should produce no output
-        assert captured_stdout.getvalue() == ""
-        assert captured_stderr.getvalue() == ""
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == ""
 
     def test_uses_certificate_from_env_var(
         self, signed_xml: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
@@ -199,36 +178,20 @@ class TestVerifyCommand:
         signed_path, cert_path = signed_xml
         monkeypatch.setenv("JUX_CERT_PATH", str(cert_path))
 
-        with patch.object(sys, "argv", ["jux-verify", "-i", str(signed_path)]):
-            exit_code = main()
+        exit_code = main(["-i", str(signed_path)])
 
         assert exit_code == 0
 
-    def test_verifies_ecdsa_signature(self, tmp_path: Path) -> None:
-        """Test verification of ECDSA signature."""
+    @pytest.mark.xdist_group("verify_rsa")
+    def test_verifies_rsa_signature(self, rsa_keypair: KeyPair, tmp_path: Path) -> None:
+        """Test verification of RSA signature."""
         # Create test XML
-        xml_content = """<?xml version="1.0"?>
-<testsuites>
-    <testsuite name="test" tests="1">
-        <testcase name="test_example"/>
-    </testsuite>
-</testsuites>
-"""
         xml_path = tmp_path / "test.xml"
-        xml_path.write_text(xml_content)
-
-        # Generate ECDSA key and certificate
-        key = generate_ecdsa_key("P-256")
-        key_path = tmp_path / "key.pem"
-        save_key(key, key_path)
-
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-        cert = cert_path.read_bytes()
+        xml_path.write_text(_UNSIGNED_XML)
 
         # Sign XML
         tree = load_xml(xml_path)
-        signed_tree = sign_xml(tree, key, cert)
+        signed_tree = sign_xml(tree, rsa_keypair.key, rsa_keypair.cert_bytes)
 
         # Save signed XML
         signed_path = tmp_path / "signed.xml"
@@ -236,496 +199,160 @@ class TestVerifyCommand:
             etree.tostring(signed_tree, xml_declaration=True, encoding="utf-8")
         )
 
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(signed_path), "--cert", str(cert_path)],
-        ):
-            exit_code = main()
+        exit_code = verify_file(signed_path, rsa_keypair.cert_path)
 
         assert exit_code == 0
 
-    def test_json_output(self, signed_xml: tuple[Path, Path]) -> None:
+    def test_json_output(
+        self, signed_xml: tuple[Path, Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test JSON output format."""
         signed_path, cert_path = signed_xml
 
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    str(signed_path),
-                    "--cert",
-                    str(cert_path),
-                    "--json",
-                ],
-            ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
+        exit_code = verify_file(signed_path, cert_path, json_output=True)
 
         assert exit_code == 0
-        output = captured_stdout.getvalue()
+        output = capsys.readouterr().out
         assert '"valid": true' in output or '"valid":true' in output
 
-    def test_json_output_for_invalid_signature(
-        self, signed_xml: tuple[Path, Path], tmp_path: Path
-    ) -> None:
-        """Test JSON output format for invalid signature."""
-        signed_path, cert_path = signed_xml
-
-        # Tamper with the signed XML
-        tree = load_xml(signed_path)
-        testcase = tree.find(".//testcase")
-        assert testcase is not None
-        testcase.set("name", "tampered_test")
-
-        tampered_path = tmp_path / "tampered.xml"
-        tampered_path.write_bytes(
-            etree.tostring(tree, xml_declaration=True, encoding="utf-8")
-        )
-
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    str(tampered_path),
-                    "--cert",
-                    str(cert_path),
-                    "--json",
-                ],
+    @pytest.mark.parametrize(
+        ("source", "quiet", "json_output", "marker"),
+        [
+            pytest.param("tampered", False, True, '"valid": false', id="tampered-json"),
+            pytest.param(
+                "unsigned",
+                False,
+                True,
+                '"error": "No signature found in XML"',
+                id="unsigned-json",
             ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        output = captured_stdout.getvalue()
-        assert '"valid": false' in output or '"valid":false' in output
-
-    def test_missing_input_file_with_json(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test missing input file with JSON output."""
-        _, cert_path = signed_xml
-
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    "/nonexistent.xml",
-                    "--cert",
-                    str(cert_path),
-                    "--json",
-                ],
+            pytest.param("unsigned", True, False, None, id="unsigned-quiet"),
+            pytest.param(
+                "missing_input",
+                False,
+                True,
+                '"error": "Input file not found"',
+                id="missing-input-json",
             ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-
-    def test_missing_cert_with_json(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test missing certificate with JSON output."""
-        signed_path, _ = signed_xml
-
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    str(signed_path),
-                    "--cert",
-                    "/nonexistent.crt",
-                    "--json",
-                ],
+            pytest.param("missing_input", True, False, None, id="missing-input-quiet"),
+            pytest.param(
+                "missing_cert",
+                False,
+                True,
+                '"error": "Certificate not found"',
+                id="missing-cert-json",
             ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-
-    def test_verification_value_error_with_json(self, tmp_path: Path) -> None:
-        """Test ValueError from verification with JSON output."""
-        # Create unsigned XML (will raise ValueError: No signature found)
-        xml_content = """<?xml version="1.0"?>
-<testsuites>
-    <testsuite name="test" tests="1">
-        <testcase name="test_example"/>
-    </testsuite>
-</testsuites>
-"""
-        xml_path = tmp_path / "unsigned.xml"
-        xml_path.write_text(xml_content)
-
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "-i", str(xml_path), "--cert", str(cert_path), "--json"],
+            pytest.param("missing_cert", True, False, None, id="missing-cert-quiet"),
+            pytest.param("bad_xml", False, True, "XML parse error", id="bad-xml-json"),
+            pytest.param("bad_xml", True, False, None, id="bad-xml-quiet"),
+            pytest.param(
+                "unexpected",
+                False,
+                True,
+                '"error": "Unexpected error"',
+                id="unexpected-json",
             ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        output = captured_stdout.getvalue()
-        assert "error" in output.lower()
+            pytest.param("unexpected", True, False, None, id="unexpected-quiet"),
+            pytest.param(
+                "unexpected",
+                False,
+                False,
+                "RuntimeError: Unexpected error",
+                id="unexpected-default",
+            ),
+        ],
+    )
+    def test_reports_failure(
+        self,
+        signed_xml: tuple[Path, Path],
+        tampered_signed_xml: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        source: str,
+        quiet: bool,
+        json_output: bool,
+        marker: str | None,
+    ) -> None:
+        """Test exit code and output for each failure source and output mode.
+
+        JSON results go to stdout and human-readable errors to stderr; a
+        ``None`` marker means the run must be silent.
+        """
+        input_path: Path | None = signed_xml[0]
+        cert_path = signed_xml[1]
+        stdin: BytesIO | None = None
+
+        if source == "tampered":
+            input_path = tampered_signed_xml
+        elif source == "unsigned":
+            input_path = None
+            stdin = BytesIO(_UNSIGNED_XML.encode("utf-8"))
+        elif source == "missing_input":
+            input_path = Path("/nonexistent.xml")
+        elif source == "missing_cert":
+            cert_path = Path("/nonexistent.crt")
+        elif source == "bad_xml":
+            input_path = tmp_path / "bad.xml"
+            input_path.write_text("This is not XML <<>>")
+        elif source == "unexpected":
+            monkeypatch.setattr(
+                "pytest_jux.commands.verify.load_xml",
+                Mock(side_effect=RuntimeError("Unexpected error")),
+            )
 
-    def test_verification_value_error_quiet_mode(self, tmp_path: Path) -> None:
-        """Test ValueError from verification with quiet mode."""
-        # Create unsigned XML (will raise ValueError: No signature found)
-        xml_content = """<?xml version="1.0"?>
-<testsuites>
-    <testsuite name="test" tests="1">
-        <testcase name="test_example"/>
-    </testsuite>
-</testsuites>
-"""
-        xml_path = tmp_path / "unsigned.xml"
-        xml_path.write_text(xml_content)
-
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(xml_path), "--cert", str(cert_path), "-q"],
-        ):
-            exit_code = main()
+        exit_code = verify_file(
+            input_path, cert_path, quiet=quiet, json_output=json_output, stdin=stdin
+        )
 
         assert exit_code == 1
-
-    def test_success_with_quiet_and_json(self, signed_xml: tuple[Path, Path]) -> None:
+        captured = capsys.readouterr()
+        if marker is None:
+            assert captured.out == ""
+            assert captured.err == ""
+        elif json_output:
+            assert marker in captured.out
+        else:
+            assert marker in captured.err
+
+    def test_success_with_quiet_and_json(
+        self, signed_xml: tuple[Path, Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test successful verification with both quiet and JSON flags."""
         signed_path, cert_path = signed_xml
 
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    str(signed_path),
-                    "--cert",
-                    str(cert_path),
-                    "-q",
-                    "--json",
-                ],
-            ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
+        exit_code = verify_file(signed_path, cert_path, quiet=True, json_output=True)
 
         assert exit_code == 0
         # Even with quiet, JSON output should be produced
-        output = captured_stdout.getvalue()
+        output = capsys.readouterr().out
         assert '"valid": true' in output or '"valid":true' in output
 
-    def test_generic_exception_with_json(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test generic exception handling with JSON output."""
-        signed_path, cert_path = signed_xml
-
-        captured_stdout = StringIO()
-
-        # Mock load_xml to raise generic exception
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    str(signed_path),
-                    "--cert",
-                    str(cert_path),
-                    "--json",
-                ],
-            ),
-            patch("sys.stdout", captured_stdout),
-            patch(
-                "pytest_jux.commands.verify.load_xml",
-                side_effect=RuntimeError("Unexpected error"),
-            ),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        output = captured_stdout.getvalue()
-        assert "error" in output.lower()
-        assert "unexpected error" in output.lower()
-
-    def test_generic_exception_with_quiet(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test generic exception handling with quiet mode."""
-        signed_path, cert_path = signed_xml
-
-        captured_stderr = StringIO()
-
-        # Mock load_xml to raise generic exception
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "-i", str(signed_path), "--cert", str(cert_path), "-q"],
-            ),
-            patch("sys.stderr", captured_stderr),
-            patch(
-                "pytest_jux.commands.verify.load_xml",
-                side_effect=RuntimeError("Unexpected error"),
-            ),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        # Quiet mode suppresses error output
-        output = captured_stderr.getvalue()
-        assert output == ""
-
-    def test_generic_exception_normal_output(
-        self, signed_xml: tuple[Path, Path]
+    def test_xml_parse_error_from_stdin_with_json(
+        self, ecdsa_keypair: KeyPair, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        """Test generic exception handling with normal output."""
-        signed_path, cert_path = signed_xml
-
-        captured_stderr = StringIO()
-
-        # Mock load_xml to raise generic exception
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "-i", str(signed_path), "--cert", str(cert_path)],
-            ),
-            patch("sys.stderr", captured_stderr),
-            patch(
-                "pytest_jux.commands.verify.load_xml",
-                side_effect=RuntimeError("Unexpected error"),
-            ),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        output = captured_stderr.getvalue()
-        assert "Error:" in output
-        assert "Unexpected error" in output
-
-    def test_missing_input_file_with_quiet(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test missing input file with quiet mode."""
-        _, cert_path = signed_xml
-
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", "/nonexistent.xml", "--cert", str(cert_path), "-q"],
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-
-    def test_missing_cert_with_quiet(self, signed_xml: tuple[Path, Path]) -> None:
-        """Test missing certificate with quiet mode."""
-        signed_path, _ = signed_xml
-
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(signed_path), "--cert", "/nonexistent.crt", "-q"],
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-
-    def test_xml_parse_error_from_file_with_json(self, tmp_path: Path) -> None:
-        """Test XML parse error from file with JSON output."""
-        # Create invalid XML
-        bad_xml_path = tmp_path / "bad.xml"
-        bad_xml_path.write_text("This is not XML <<>>")
-
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        captured_stdout = StringIO()
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                [
-                    "jux-verify",
-                    "-i",
-                    str(bad_xml_path),
-                    "--cert",
-                    str(cert_path),
-                    "--json",
-                ],
-            ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        output = captured_stdout.getvalue()
-        assert "error" in output.lower()
-        assert "parse" in output.lower()
-
-    def test_xml_parse_error_from_file_with_quiet(self, tmp_path: Path) -> None:
-        """Test XML parse error from file with quiet mode."""
-        # Create invalid XML
-        bad_xml_path = tmp_path / "bad.xml"
-        bad_xml_path.write_text("This is not XML <<>>")
-
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(bad_xml_path), "--cert", str(cert_path), "-q"],
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-
-    def test_xml_parse_error_from_stdin_with_json(self, tmp_path: Path) -> None:
         """Test XML parse error from stdin with JSON output."""
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
+        cert_path = ecdsa_keypair.cert_path
 
         # Invalid XML on stdin
-        mock_stdin = StringIO("This is not XML <<>>")
-        captured_stdout = StringIO()
+        mock_stdin = BytesIO(b"This is not XML <<>>")
 
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "--cert", str(cert_path), "--json"],
-            ),
-            patch("sys.stdin", mock_stdin),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
+        exit_code = verify_file(None, cert_path, json_output=True, stdin=mock_stdin)
 
         assert exit_code == 1
-        output = captured_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "error" in output.lower()
 
-    def test_xml_parse_error_from_stdin_with_quiet(self, tmp_path: Path) -> None:
+    def test_xml_parse_error_from_stdin_with_quiet(
+        self, ecdsa_keypair: KeyPair
+    ) -> None:
         """Test XML parse error from stdin with quiet mode."""
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
+        cert_path = ecdsa_keypair.cert_path
 
         # Invalid XML on stdin
-        mock_stdin = StringIO("This is not XML <<>>")
-
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "--cert", str(cert_path), "-q"],
-            ),
-            patch("sys.stdin", mock_stdin),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-
-    def test_signature_missing_with_json(self, tmp_path: Path) -> None:
-        """Test signature missing error with JSON output."""
-        # Create unsigned XML
-        xml_content = """<?xml version="1.0"?>
-<testsuites>
-    <testsuite name="test" tests="1">
-        <testcase name="test_example"/>
-    </testsuite>
-</testsuites>
-"""
-        xml_path = tmp_path / "unsigned.xml"
-        xml_path.write_text(xml_content)
-
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        captured_stdout = StringIO()
+        mock_stdin = BytesIO(b"This is not XML <<>>")
 
-        with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "-i", str(xml_path), "--cert", str(cert_path), "--json"],
-            ),
-            patch("sys.stdout", captured_stdout),
-        ):
-            exit_code = main()
-
-        assert exit_code == 1
-        output = captured_stdout.getvalue()
-        assert "signature" in output.lower()
-
-    def test_signature_missing_with_quiet(self, tmp_path: Path) -> None:
-        """Test signature missing error with quiet mode."""
-        # Create unsigned XML
-        xml_content = """<?xml version="1.0"?>
-<testsuites>
-    <testsuite name="test" tests="1">
-        <testcase name="test_example"/>
-    </testsuite>
-</testsuites>
-"""
-        xml_path = tmp_path / "unsigned.xml"
-        xml_path.write_text(xml_content)
-
-        # Generate certificate
-        key = generate_rsa_key(2048)
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-
-        with patch.object(
-            sys,
-            "argv",
-            ["jux-verify", "-i", str(xml_path), "--cert", str(cert_path), "-q"],
-        ):
-            exit_code = main()
+        exit_code = verify_file(None, cert_path, quiet=True, stdin=mock_stdin)
 
         assert exit_code == 1
 
@@ -737,11 +364,6 @@ class TestVerifyCommand:
 
         # Mock load_xml to raise generic exception
         with (
-            patch.object(
-                sys,
-                "argv",
-                ["jux-verify", "-i", str(signed_path), "--cert", str(cert_path)],
-            ),
             patch(
                 "pytest_jux.commands.verify.load_xml",
                 side_effect=RuntimeError("Unexpected error"),
@@ -749,4 +371,4 @@ class TestVerifyCommand:
             patch.dict("os.environ", {"JUX_DEBUG": "1"}),
         ):
             with pytest.raises(RuntimeError, match="Unexpected error"):
-                main()
+                verify_file(signed_path, cert_path)
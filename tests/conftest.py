@@ -12,7 +12,11 @@ This module provides fixtures for:
 
 from __future__ import annotations
 
+import contextlib
+import os
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -54,7 +58,9 @@ except ImportError:
     LIVE_MOCK_SERVER_AVAILABLE = False
 
 if TYPE_CHECKING:
-    pass
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+    from pytest_jux.signer import PrivateKey
 
 
 @pytest.fixture
@@ -76,28 +82,71 @@ def pytester_with_jux(pytester):
     return pytester
 
 
-@pytest.fixture
+# Server pre-started by pytest_configure for ``-m integration`` runs, so its
+# startup overlaps with collection instead of the first integration test
+_live_mock_server_startup: Future[Any] | None = None
+_live_mock_server_stack = contextlib.ExitStack()
+
+
+def _prestart_live_mock_server(config: pytest.Config) -> None:
+    """Start the LiveMockServer in the background when integration tests run."""
+    global _live_mock_server_startup
+    markexpr = config.getoption("markexpr", "")
+    if (
+        not LIVE_MOCK_SERVER_AVAILABLE
+        or "integration" not in markexpr
+        or "not integration" in markexpr
+    ):
+        return
+    # The xdist controller runs no tests; each worker pre-starts its own server
+    if config.getoption("numprocesses", None) and not hasattr(config, "workerinput"):
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mock-server")
+    _live_mock_server_startup = executor.submit(
+        _live_mock_server_stack.enter_context,
+        LiveMockServer(),  # type: ignore[name-defined]
+    )
+    executor.shutdown(wait=False)
+
+
+def _live_mock_server() -> Iterator[Any]:
+    """Start a LiveMockServer, skipping when jux-mock-server is missing."""
+    if not LIVE_MOCK_SERVER_AVAILABLE:
+        pytest.skip(
+            "LiveMockServer not available. Requires jux-mock-server v0.5.0+ "
+            "(install with: uv pip install -e ../jux-mock-server)"
+        )
+    if _live_mock_server_startup is not None:
+        yield _live_mock_server_startup.result()
+        return
+    with LiveMockServer() as server:  # type: ignore[name-defined]
+        yield server
+
+
+@pytest.fixture(scope="session")
 def live_mock_server() -> Iterator[Any]:
     """Provide a live mock Jux server for external HTTP client tests.
 
     This fixture starts a real HTTP server on a random port, suitable
-    for testing with external HTTP clients like JuxAPIClient.
+    for testing with external HTTP clients like JuxAPIClient. The server
+    is shared by the whole session, so recorded requests accumulate:
+    compare request counts before and after, and avoid server-side state
+    such as ``configure_error``.
+    Under pytest-xdist every worker runs its own session, and so its own
+    server on its own random port; counts never include other workers'
+    traffic.
+    With ``-m integration`` the server is already started during
+    collection, so the first test does not pay for its startup.
 
     Requires jux-mock-server v0.5.0+ (LiveMockServer feature).
 
     Yields:
         LiveMockServer instance with url property and request recording.
     """
-    if not LIVE_MOCK_SERVER_AVAILABLE:
-        pytest.skip(
-            "LiveMockServer not available. Requires jux-mock-server v0.5.0+ "
-            "(install with: uv pip install -e ../jux-mock-server)"
-        )
-    with LiveMockServer() as server:  # type: ignore[name-defined]
-        yield server
+    yield from _live_mock_server()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_junit_xml() -> str:
     """Sample JUnit XML for integration testing."""
     return """<?xml version="1.0" encoding="UTF-8"?>
@@ -118,6 +167,12 @@ def sample_junit_xml() -> str:
 """
 
 
+@pytest.fixture(scope="session")
+def sample_junit_xml_bytes(sample_junit_xml: str) -> bytes:
+    """UTF-8 encoded ``sample_junit_xml``, for writing report files."""
+    return sample_junit_xml.encode("utf-8")
+
+
 # =============================================================================
 # Local Fixtures
 # =============================================================================
@@ -165,6 +220,62 @@ def local_junit_xml_dir() -> Path:
     return JUNIT_XML_DIR
 
 
+# =============================================================================
+# Signing Key Pairs
+# =============================================================================
+
+
+# Key size for RSA keys generated on the fly by tests that only need a
+# working key for the sign/verify code path. RSA keygen cost grows roughly
+# cubically with the modulus, so 1024 bits is several times cheaper than
+# 2048. This is deliberately below what jux-keygen accepts; 2048-bit
+# coverage comes from the committed rsa_2048 fixture key.
+DEFAULT_TEST_RSA_BITS = 1024
+
+
+def generate_test_rsa_key(key_size: int = DEFAULT_TEST_RSA_BITS) -> RSAPrivateKey:
+    """Generate a throwaway RSA key for tests (not for key-strength checks)."""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    return rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+
+
+@dataclass(frozen=True)
+class KeyPair:
+    """Loaded private key with its committed PEM key and certificate files."""
+
+    key: PrivateKey
+    key_path: Path
+    cert_path: Path
+    cert_bytes: bytes
+
+
+def _load_key_pair(name: str) -> KeyPair:
+    """Load the ``<name>.pem`` / ``<name>.crt`` pair from the keys directory."""
+    from pytest_jux.signer import load_private_key
+
+    key_path = KEYS_DIR / f"{name}.pem"
+    cert_path = KEYS_DIR / f"{name}.crt"
+    return KeyPair(
+        key=load_private_key(key_path),
+        key_path=key_path,
+        cert_path=cert_path,
+        cert_bytes=cert_path.read_bytes(),
+    )
+
+
+@pytest.fixture(scope="session")
+def rsa_keypair() -> KeyPair:
+    """RSA 2048-bit key pair, loaded once per test session."""
+    return _load_key_pair("rsa_2048")
+
+
+@pytest.fixture(scope="session")
+def ecdsa_keypair() -> KeyPair:
+    """ECDSA P-256 key pair, loaded once per test session."""
+    return _load_key_pair("ecdsa_p256")
+
+
 # =============================================================================
 # Shared JUnit XML Fixtures
 # =============================================================================
@@ -194,7 +305,12 @@ def shared_fixtures_dir() -> Path:
 
 
 def get_local_junit_xml_files() -> list[Path]:
-    """Get all local JUnit XML fixture files."""
+    """Get all local JUnit XML fixture files.
+
+    Only files that exist are returned, so tests parametrized over them need
+    no per-case existence check; with no fixtures the parameter set is empty
+    and pytest skips the test.
+    """
     if not JUNIT_XML_DIR.exists():
         return []
     return sorted(JUNIT_XML_DIR.glob("*.xml"))
@@ -205,13 +321,73 @@ def get_local_junit_xml_files() -> list[Path]:
 # =============================================================================
 
 
+# OPENSSL_ia32cap bits for the extensions that speed up signing/verification:
+# AES-NI and PCLMULQDQ in the first capability word, SHA-NI in the second.
+_OPENSSL_CAP_BITS = (
+    ("AES-NI", 0, 0x200000200000000),
+    ("SHA-NI", 1, 0x20000000),
+)
+
+
+def _masked_openssl_extensions(ia32cap: str) -> list[str]:
+    """Names of hardware crypto extensions disabled by an OPENSSL_ia32cap value.
+
+    Each ``:``-separated word either replaces the detected capability vector
+    (``0x...``) or clears bits from it (``~0x...``).
+    """
+    words = ia32cap.split(":")
+    masked = []
+    for name, index, bits in _OPENSSL_CAP_BITS:
+        word = words[index].strip() if index < len(words) else ""
+        if not word:
+            continue
+        try:
+            if word.startswith("~"):
+                disabled = int(word[1:], 0) & bits != 0
+            else:
+                disabled = int(word, 0) & bits != bits
+        except ValueError:
+            continue
+        if disabled:
+            masked.append(name)
+    return masked
+
+
 def pytest_configure(config: pytest.Config) -> None:
-    """Register custom markers."""
+    """Register custom markers and check OpenSSL hardware acceleration.
+
+    Crypto-heavy tests (signing, verification) slow down by an order of
+    magnitude when OPENSSL_ia32cap disables AES-NI or SHA-NI. This only warns,
+    so the software fallback can still be exercised on purpose by setting the
+    variable.
+
+    Integration runs also pre-start the shared LiveMockServer here.
+    """
     config.addinivalue_line(
         "markers",
         "shared_fixtures: tests that require shared junit-xml-test-fixtures",
     )
 
+    masked = _masked_openssl_extensions(os.environ.get("OPENSSL_ia32cap", ""))
+    if masked:
+        config.issue_config_time_warning(
+            pytest.PytestConfigWarning(
+                f"OPENSSL_ia32cap disables {', '.join(masked)}; "
+                "crypto tests will run on the software fallback"
+            ),
+            stacklevel=2,
+        )
+
+    _prestart_live_mock_server(config)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stop the LiveMockServer pre-started by pytest_configure, if any."""
+    if _live_mock_server_startup is not None:
+        # Let a still-running startup finish so its server gets stopped too
+        _live_mock_server_startup.exception()
+        _live_mock_server_stack.close()
+
 
 @pytest.fixture(autouse=True)
 def skip_shared_fixture_tests(request: pytest.FixtureRequest) -> Iterator[None]:
@@ -1,16 +1,5 @@
-# Copyright 2025 Georges Martin
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#     http://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF THE KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
+# SPDX-FileCopyrightText: 2025 Georges Martin <jrjsmrtn@gmail.com>
+# SPDX-License-Identifier: Apache-2.0
 
 """
 Signature attack tests for pytest-jux.
@@ -24,54 +13,26 @@ Tests protection against common XML signature attacks:
 
 import pytest
 
-
-class TestSignatureStripping:
-    """Test protection against signature stripping attacks."""
-
-    def test_unsigned_xml_rejected(self):
-        """Verify unsigned XML is rejected by verification."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-    def test_signature_removal_detected(self):
-        """Verify signature removal is detected."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-
-class TestSignatureWrapping:
-    """Test protection against XML signature wrapping attacks."""
-
-    def test_wrapped_signature_rejected(self):
-        """Verify wrapped signatures are rejected."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-    def test_signature_reference_validation(self):
-        """Verify signature references are validated correctly."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-
-class TestAlgorithmConfusion:
-    """Test protection against algorithm confusion attacks."""
-
-    def test_none_algorithm_rejected(self):
-        """Verify 'none' algorithm is rejected."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-    def test_weak_algorithms_rejected(self):
-        """Verify weak algorithms (MD5, SHA-1) are rejected."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-    def test_algorithm_downgrade_prevented(self):
-        """Verify algorithm downgrade attacks are prevented."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-
-class TestKeySubstitution:
-    """Test protection against key substitution attacks."""
-
-    def test_wrong_key_rejected(self):
-        """Verify signature with wrong key is rejected."""
-        pytest.skip("Implementation pending - Sprint 1")
-
-    def test_key_id_validation(self):
-        """Verify key ID validation if implemented."""
-        pytest.skip("Implementation pending - Sprint 1")
+pytestmark = pytest.mark.skip(reason="Implementation pending - Sprint 1")
+
+
+@pytest.mark.parametrize(
+    "attack",
+    [
+        # Signature stripping
+        "unsigned_xml_rejected",
+        "signature_removal_detected",
+        # Signature wrapping
+        "wrapped_signature_rejected",
+        "signature_reference_validation",
+        # Algorithm confusion
+        "none_algorithm_rejected",
+        "weak_algorithms_rejected",
+        "algorithm_downgrade_prevented",
+        # Key substitution
+        "wrong_key_rejected",
+        "key_id_validation",
+    ],
+)
+def test_signature_attack(attack: str) -> None:
+    """Verify the signature verifier defeats the given attack."""
@@ -7,6 +7,7 @@ import json
 import re
 import sys
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -14,6 +15,24 @@ import pytest
 from pytest_jux.metadata import EnvironmentMetadata, capture_metadata
 
 
+def _base_metadata(**overrides: Any) -> EnvironmentMetadata:
+    """Fixed metadata for tests that only vary a field or two.
+
+    Built on every call so that no test shares the mutable tool_versions dict.
+    """
+    fields: dict[str, Any] = {
+        "hostname": "test-host",
+        "username": "test-user",
+        "platform": "Test-Platform",
+        "python_version": "3.11.0",
+        "timestamp": "2025-10-17T10:30:00Z",
+        "project_name": "test-project",
+        "tool_versions": {"pytest": "8.0.0", "pytest_jux": "0.1.4"},
+        "env": None,
+    }
+    return EnvironmentMetadata(**{**fields, **overrides})
+
+
 class TestEnvironmentMetadata:
     """Tests for EnvironmentMetadata class."""
 
@@ -210,53 +229,17 @@ class TestEnvironmentMetadata:
 
     def test_metadata_equality(self) -> None:
         """Should support equality comparison."""
-        metadata1 = EnvironmentMetadata(
-            hostname="test-host",
-            username="test-user",
-            platform="Test-Platform",
-            python_version="3.11.0",
-            timestamp="2025-10-17T10:30:00Z",
-            project_name="test-project",
-            tool_versions={"pytest": "8.0.0", "pytest_jux": "0.1.4"},
-            env=None,
-        )
+        metadata1 = _base_metadata()
 
-        metadata2 = EnvironmentMetadata(
-            hostname="test-host",
-            username="test-user",
-            platform="Test-Platform",
-            python_version="3.11.0",
-            timestamp="2025-10-17T10:30:00Z",
-            project_name="test-project",
-            tool_versions={"pytest": "8.0.0", "pytest_jux": "0.1.4"},
-            env=None,
-        )
+        metadata2 = _base_metadata()
 
         assert metadata1 == metadata2
 
     def test_metadata_inequality(self) -> None:
         """Should detect differences in metadata."""
-        metadata1 = EnvironmentMetadata(
-            hostname="test-host-1",
-            username="test-user",
-            platform="Test-Platform",
-            python_version="3.11.0",
-            timestamp="2025-10-17T10:30:00Z",
-            project_name="test-project",
-            tool_versions={"pytest": "8.0.0", "pytest_jux": "0.1.4"},
-            env=None,
-        )
+        metadata1 = _base_metadata(hostname="test-host-1")
 
-        metadata2 = EnvironmentMetadata(
-            hostname="test-host-2",  # Different hostname
-            username="test-user",
-            platform="Test-Platform",
-            python_version="3.11.0",
-            timestamp="2025-10-17T10:30:00Z",
-            project_name="test-project",
-            tool_versions={"pytest": "8.0.0", "pytest_jux": "0.1.4"},
-            env=None,
-        )
+        metadata2 = _base_metadata(hostname="test-host-2")
 
         assert metadata1 != metadata2
 
@@ -322,16 +305,7 @@ class TestEnvironmentMetadata:
 
     def test_dataclass_with_none_env(self) -> None:
         """Should handle None env in dataclass."""
-        metadata = EnvironmentMetadata(
-            hostname="test.example.com",
-            username="testuser",
-            platform="Linux-5.10.0",
-            python_version="3.11.0",
-            timestamp="2025-10-19T10:00:00Z",
-            project_name="test-project",
-            tool_versions={"pytest": "8.0.0", "pytest_jux": "0.1.0"},
-            env=None,
-        )
+        metadata = _base_metadata()
 
         assert metadata.env is None
         data = metadata.to_dict()
@@ -22,6 +22,8 @@ from lxml import etree
 
 from pytest_jux.plugin import pytest_metadata
 
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
 
 class TestPytestMetadataHook:
     """Tests for pytest_metadata hook integration."""
@@ -158,11 +160,11 @@ class TestMetadataInJUnitXML:
         xml_file = pytester.path / "report.xml"
         assert xml_file.exists()
 
-        tree = etree.parse(str(xml_file))
+        tree = etree.parse(str(xml_file), _PARSER)
         root = tree.getroot()
 
         # Find <properties> element
-        properties = root.find(".//properties")
+        properties = next(root.iter("properties"), None)
         assert properties is not None, "No <properties> element found in JUnit XML"
 
         # Extract property names
@@ -203,8 +205,8 @@ class TestMetadataInJUnitXML:
         assert result.ret == 0
 
         # Parse XML
-        tree = etree.parse(str(pytester.path / "report.xml"))
-        properties = tree.find(".//properties")
+        tree = etree.parse(str(pytester.path / "report.xml"), _PARSER)
+        properties = next(tree.iter("properties"), None)
         assert properties is not None
 
         # Get property values as dict
@@ -241,8 +243,8 @@ class TestMetadataInJUnitXML:
         )
         assert result.ret == 0
 
-        tree = etree.parse(str(pytester.path / "report.xml"))
-        properties = tree.find(".//properties")
+        tree = etree.parse(str(pytester.path / "report.xml"), _PARSER)
+        properties = next(tree.iter("properties"), None)
 
         props = {
             prop.get("name"): prop.get("value")
@@ -293,14 +295,14 @@ class TestMetadataInSignature:
 
         # Parse signed XML
         xml_file = pytester.path / "report.xml"
-        tree = etree.parse(str(xml_file))
+        tree = etree.parse(str(xml_file), _PARSER)
 
         # Verify signature exists
         signature = tree.find(".//{http://www.w3.org/2000/09/xmldsig#}Signature")
         assert signature is not None, "No XMLDSig signature found"
 
         # Verify metadata properties exist
-        properties = tree.find(".//properties")
+        properties = next(tree.iter("properties"), None)
         assert properties is not None
 
         props = {
@@ -361,10 +363,10 @@ class TestMetadataInSignature:
 
         # Load signed XML
         xml_file = pytester.path / "report.xml"
-        tree = etree.parse(str(xml_file))
+        tree = etree.parse(str(xml_file), _PARSER)
 
         # Tamper with metadata property
-        properties = tree.find(".//properties")
+        properties = next(tree.iter("properties"), None)
         for prop in properties.findall("property"):
             if prop.get("name") == "jux:hostname":
                 prop.set("value", "tampered-hostname")
@@ -377,7 +379,7 @@ class TestMetadataInSignature:
         # Verify signature should fail
         from pytest_jux.signer import verify_signature
 
-        tampered_tree = etree.parse(str(tampered_file))
+        tampered_tree = etree.parse(str(tampered_file), _PARSER)
         assert not verify_signature(tampered_tree.getroot()), (
             "Signature should be invalid after tampering"
         )
@@ -436,10 +438,10 @@ storage_path = {storage_path}
         assert len(report_files) > 0, "No reports stored"
 
         # Parse stored report
-        stored_tree = etree.parse(str(report_files[0]))
+        stored_tree = etree.parse(str(report_files[0]), _PARSER)
 
         # Verify metadata is embedded in XML
-        properties = stored_tree.find(".//properties")
+        properties = next(stored_tree.iter("properties"), None)
         assert properties is not None
 
         props = {
@@ -476,12 +478,12 @@ class TestBackwardCompatibility:
         xml_file.write_text(xml_content)
 
         # Parse and verify it's valid XML
-        tree = etree.parse(str(xml_file))
+        tree = etree.parse(str(xml_file), _PARSER)
         root = tree.getroot()
         assert root.tag == "testsuites"
 
         # Properties exist but no jux metadata
-        properties = tree.find(".//properties")
+        properties = next(tree.iter("properties"), None)
         assert properties is not None
         props = {
             prop.get("name"): prop.get("value")
@@ -512,8 +514,8 @@ class TestMetadataNamespacePrefix:
         )
         assert result.ret == 0
 
-        tree = etree.parse(str(pytester.path / "report.xml"))
-        properties = tree.find(".//properties")
+        tree = etree.parse(str(pytester.path / "report.xml"), _PARSER)
+        properties = next(tree.iter("properties"), None)
 
         # Get all property names
         prop_names = [prop.get("name") for prop in properties.findall("property")]
@@ -559,8 +561,8 @@ class TestMetadataNamespacePrefix:
         )
         assert result.ret == 0
 
-        tree = etree.parse(str(pytester.path / "report.xml"))
-        properties = tree.find(".//properties")
+        tree = etree.parse(str(pytester.path / "report.xml"), _PARSER)
+        properties = next(tree.iter("properties"), None)
         props = {
             prop.get("name"): prop.get("value")
             for prop in properties.findall("property")
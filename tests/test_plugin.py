@@ -8,10 +8,36 @@ from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+from conftest import KEYS_DIR
 from lxml import etree
 
 from pytest_jux.config import StorageMode
-from pytest_jux.plugin import pytest_addoption, pytest_configure, pytest_sessionfinish
+from pytest_jux.plugin import (
+    pytest_addoption,
+    pytest_configure,
+    pytest_sessionfinish,
+    pytest_terminal_summary,
+    pytest_unconfigure,
+)
+
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
+_JUNIT_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+    <testsuite name="test_suite" tests="1" failures="0" errors="0">
+        <testcase classname="test_module" name="test_example" time="0.001"/>
+    </testsuite>
+</testsuites>
+"""
+
+
+def _first_testcase_name(xml_path: Path) -> str | None:
+    """Return the first testcase name, stopping the parse as soon as it is seen."""
+    for _, testcase in etree.iterparse(
+        str(xml_path), events=("start",), tag="testcase"
+    ):
+        return testcase.get("name")
+    return None
 
 
 @pytest.fixture
@@ -22,6 +48,27 @@ def mock_parser() -> Mock:
     return parser
 
 
+@pytest.fixture(scope="module")
+def registered_parser() -> Mock:
+    """Mock parser that pytest_addoption has registered its options on."""
+    parser = Mock()
+    parser.getgroup = Mock(return_value=Mock())
+    pytest_addoption(parser)
+    return parser
+
+
+@pytest.fixture(scope="module")
+def registered_options(registered_parser: Mock) -> set[str]:
+    """Option strings passed positionally to the Jux group's addoption()."""
+    mock_group = registered_parser.getgroup.return_value
+    return {
+        arg
+        for call in mock_group.addoption.mock_calls
+        for arg in call.args
+        if isinstance(arg, str)
+    }
+
+
 @pytest.fixture
 def mock_config() -> Mock:
     """Return a mock pytest config."""
@@ -42,98 +89,41 @@ def mock_session() -> Mock:
     return session
 
 
-@pytest.fixture
-def test_key_path(tmp_path: Path) -> Path:
-    """Create a test key file."""
-    key_path = tmp_path / "test_key.pem"
-    # Copy actual test key
-    import shutil
-
-    fixture_key = Path(__file__).parent / "fixtures" / "keys" / "rsa_2048.pem"
-    shutil.copy(fixture_key, key_path)
-    return key_path
-
+@pytest.fixture(scope="session")
+def test_key_path() -> Path:
+    """Pre-generated RSA 2048-bit test key (read-only, used in place)."""
+    return KEYS_DIR / "rsa_2048.pem"
 
-@pytest.fixture
-def test_cert_path(tmp_path: Path) -> Path:
-    """Create a test certificate file."""
-    cert_path = tmp_path / "test_cert.crt"
-    # Copy actual test certificate
-    import shutil
 
-    fixture_cert = Path(__file__).parent / "fixtures" / "keys" / "rsa_2048.crt"
-    shutil.copy(fixture_cert, cert_path)
-    return cert_path
+@pytest.fixture(scope="session")
+def test_cert_path() -> Path:
+    """Pre-generated certificate matching ``test_key_path`` (read-only)."""
+    return KEYS_DIR / "rsa_2048.crt"
 
 
 @pytest.fixture
 def test_junit_xml(tmp_path: Path) -> Path:
-    """Create a test JUnit XML file."""
+    """Create a test JUnit XML file (per test, since signing rewrites it)."""
     xml_path = tmp_path / "junit.xml"
-    xml_content = """<?xml version="1.0" encoding="utf-8"?>
-<testsuites>
-    <testsuite name="test_suite" tests="1" failures="0" errors="0">
-        <testcase classname="test_module" name="test_example" time="0.001"/>
-    </testsuite>
-</testsuites>
-"""
-    xml_path.write_text(xml_content)
+    xml_path.write_bytes(_JUNIT_XML)
     return xml_path
 
 
 class TestPytestAddoption:
     """Tests for pytest_addoption hook."""
 
-    def test_adds_jux_group(self, mock_parser: Mock) -> None:
+    def test_adds_jux_group(self, registered_parser: Mock) -> None:
         """Test that plugin adds Jux option group."""
-        pytest_addoption(mock_parser)
-        mock_parser.getgroup.assert_called_once_with(
+        registered_parser.getgroup.assert_called_once_with(
             "jux", "Jux test report signing and publishing"
         )
 
-    def test_adds_jux_sign_option(self, mock_parser: Mock) -> None:
-        """Test that plugin adds --jux-sign option."""
-        mock_group = Mock()
-        mock_parser.getgroup.return_value = mock_group
-
-        pytest_addoption(mock_parser)
-
-        # Verify --jux-sign option was added
-        calls = [call[1] for call in mock_group.addoption.mock_calls]
-        assert any("--jux-sign" in str(call) for call in calls)
-
-    def test_adds_jux_key_option(self, mock_parser: Mock) -> None:
-        """Test that plugin adds --jux-key option."""
-        mock_group = Mock()
-        mock_parser.getgroup.return_value = mock_group
-
-        pytest_addoption(mock_parser)
-
-        # Verify --jux-key option was added
-        calls = [call[1] for call in mock_group.addoption.mock_calls]
-        assert any("--jux-key" in str(call) for call in calls)
-
-    def test_adds_jux_cert_option(self, mock_parser: Mock) -> None:
-        """Test that plugin adds --jux-cert option."""
-        mock_group = Mock()
-        mock_parser.getgroup.return_value = mock_group
-
-        pytest_addoption(mock_parser)
-
-        # Verify --jux-cert option was added
-        calls = [call[1] for call in mock_group.addoption.mock_calls]
-        assert any("--jux-cert" in str(call) for call in calls)
-
-    def test_adds_jux_publish_option(self, mock_parser: Mock) -> None:
-        """Test that plugin adds --jux-publish option."""
-        mock_group = Mock()
-        mock_parser.getgroup.return_value = mock_group
-
-        pytest_addoption(mock_parser)
-
-        # Verify --jux-publish option was added
-        calls = [call[1] for call in mock_group.addoption.mock_calls]
-        assert any("--jux-publish" in str(call) for call in calls)
+    @pytest.mark.parametrize(
+        "flag", ["--jux-sign", "--jux-key", "--jux-cert", "--jux-publish"]
+    )
+    def test_adds_jux_option(self, registered_options: set[str], flag: str) -> None:
+        """Test that plugin adds each Jux command-line option."""
+        assert flag in registered_options
 
 
 class TestPytestConfigure:
@@ -349,23 +339,7 @@ class TestPytestSessionfinish:
         pytest_sessionfinish(mock_session, 0)
 
         # XML should be unchanged
-        original_content = test_junit_xml.read_text()
-        assert "<Signature" not in original_content
-
-    def test_does_nothing_when_signing_disabled(
-        self, mock_session: Mock, test_junit_xml: Path
-    ) -> None:
-        """Test that hook does nothing when signing is disabled."""
-        mock_session.config._jux_enabled = True
-        mock_session.config._jux_sign = False
-        mock_session.config.option.xmlpath = str(test_junit_xml)
-
-        # Should not raise any errors
-        pytest_sessionfinish(mock_session, 0)
-
-        # XML should be unchanged
-        original_content = test_junit_xml.read_text()
-        assert "<Signature" not in original_content
+        assert b"Signature" not in test_junit_xml.read_bytes()
 
     def test_does_nothing_without_junit_xml(self, mock_session: Mock) -> None:
         """Test that hook does nothing when no JUnit XML is configured."""
@@ -392,11 +366,14 @@ class TestPytestSessionfinish:
         pytest_sessionfinish(mock_session, 0)
 
         # Verify XML was signed
-        signed_content = test_junit_xml.read_text()
-        assert "<Signature" in signed_content or "ds:Signature" in signed_content
+        assert b"Signature" in test_junit_xml.read_bytes()
 
     def test_signs_junit_xml_without_certificate(
-        self, mock_session: Mock, test_junit_xml: Path, test_key_path: Path
+        self,
+        mock_session: Mock,
+        test_junit_xml: Path,
+        test_key_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that hook can sign JUnit XML without certificate."""
         mock_session.config._jux_sign = True
@@ -404,22 +381,30 @@ class TestPytestSessionfinish:
         mock_session.config._jux_cert_path = None
         mock_session.config.option.xmlpath = str(test_junit_xml)
 
+        # Keep the report in memory; the file round-trip is covered above
+        written: list[bytes] = []
+        monkeypatch.setattr(
+            "pytest_jux.plugin.load_xml",
+            lambda path: etree.fromstring(_JUNIT_XML, _PARSER),
+        )
+        monkeypatch.setattr(
+            Path, "write_bytes", lambda path, data: written.append(data)
+        )
+
         # Execute hook
         pytest_sessionfinish(mock_session, 0)
 
         # Verify XML was signed
-        signed_content = test_junit_xml.read_text()
-        assert "<Signature" in signed_content or "ds:Signature" in signed_content
+        assert len(written) == 1
+        assert b"Signature" in written[0]
 
     def test_preserves_original_junit_xml_content(
         self, mock_session: Mock, test_junit_xml: Path, test_key_path: Path
     ) -> None:
         """Test that signing preserves original JUnit XML content."""
         # Read original content
-        original_tree = etree.parse(str(test_junit_xml))
-        original_testcase = original_tree.find(".//testcase")
-        assert original_testcase is not None
-        original_name = original_testcase.get("name")
+        original_name = _first_testcase_name(test_junit_xml)
+        assert original_name is not None
 
         # Configure and sign
         mock_session.config._jux_sign = True
@@ -430,10 +415,7 @@ class TestPytestSessionfinish:
         pytest_sessionfinish(mock_session, 0)
 
         # Verify original content is preserved
-        signed_tree = etree.parse(str(test_junit_xml))
-        signed_testcase = signed_tree.find(".//testcase")
-        assert signed_testcase is not None
-        assert signed_testcase.get("name") == original_name
+        assert _first_testcase_name(test_junit_xml) == original_name
 
     def test_handles_invalid_key_path(
         self, mock_session: Mock, test_junit_xml: Path
@@ -601,7 +583,7 @@ class TestPytestSessionfinishWithStorage:
         # Parse stored report and verify metadata is embedded
         from lxml import etree
 
-        tree = etree.parse(str(report_files[0]))
+        tree = etree.parse(str(report_files[0]), _PARSER)
         _properties = tree.find(
             ".//properties"
         )  # Prefixed to indicate intentionally unused
@@ -647,6 +629,7 @@ class TestPytestSessionfinishWithStorage:
 class TestPluginIntegration:
     """Integration tests for the full plugin workflow."""
 
+    @pytest.mark.slow
     def test_full_workflow_with_signing(
         self, mock_parser: Mock, test_junit_xml: Path, test_key_path: Path
     ) -> None:
@@ -671,14 +654,13 @@ class TestPluginIntegration:
         pytest_sessionfinish(mock_session, 0)
 
         # Verify result
-        signed_content = test_junit_xml.read_text()
-        assert "<Signature" in signed_content or "ds:Signature" in signed_content
+        assert b"Signature" in test_junit_xml.read_bytes()
 
     def test_workflow_without_signing(
         self, mock_parser: Mock, test_junit_xml: Path
     ) -> None:
-        """Test workflow when signing is disabled."""
-        original_content = test_junit_xml.read_text()
+        """Test that sessionfinish leaves the report alone when signing is off."""
+        original_content = test_junit_xml.read_bytes()
 
         # Configure without signing
         mock_config = Mock()
@@ -693,8 +675,8 @@ class TestPluginIntegration:
         pytest_sessionfinish(mock_session, 0)
 
         # Verify XML is unchanged
-        assert test_junit_xml.read_text() == original_content
-        assert "<Signature" not in original_content
+        assert test_junit_xml.read_bytes() == original_content
+        assert b"Signature" not in original_content
 
 
 class TestPytestMetadataIntegration:
@@ -739,10 +721,10 @@ class TestPytestMetadataIntegration:
         pytest_sessionfinish(mock_session, 0)
 
         # Parse signed XML
-        signed_tree = etree.parse(str(xml_path))
+        signed_tree = etree.parse(str(xml_path), _PARSER)
 
         # Verify property tags are still present
-        properties = signed_tree.findall(".//property")
+        properties = list(signed_tree.iter("property"))
         assert len(properties) == 3
 
         # Verify property values
@@ -779,8 +761,8 @@ class TestPytestMetadataIntegration:
 
         pytest_sessionfinish(mock_session, 0)
 
-        signed_tree = etree.parse(str(xml_path))
-        properties_sections = signed_tree.findall(".//properties")
+        signed_tree = etree.parse(str(xml_path), _PARSER)
+        properties_sections = list(signed_tree.iter("properties"))
         assert len(properties_sections) == 1
 
     def test_canonical_hash_includes_metadata(
@@ -849,8 +831,8 @@ class TestPytestMetadataIntegration:
 
         pytest_sessionfinish(mock_session, 0)
 
-        signed_tree = etree.parse(str(xml_path))
-        properties = signed_tree.findall(".//property")
+        signed_tree = etree.parse(str(xml_path), _PARSER)
+        properties = list(signed_tree.iter("property"))
 
         # All 8 properties should be preserved
         assert len(properties) == 8
@@ -898,8 +880,8 @@ class TestPytestMetadataIntegration:
         assert len(report_files) > 0
 
         # Verify stored report has property tags
-        stored_tree = etree.parse(str(report_files[0]))
-        properties = stored_tree.findall(".//property")
+        stored_tree = etree.parse(str(report_files[0]), _PARSER)
+        properties = list(stored_tree.iter("property"))
         assert len(properties) == 1
         assert properties[0].get("name") == "test_metadata"
         assert properties[0].get("value") == "preserved"
@@ -934,7 +916,7 @@ class TestEdgeCases:
         self, mock_session: Mock, test_junit_xml: Path, test_key_path: Path
     ) -> None:
         """Test that sessionfinish doesn't corrupt XML on signing error."""
-        original_content = test_junit_xml.read_text()
+        original_content = test_junit_xml.read_bytes()
 
         mock_session.config._jux_enabled = True
         mock_session.config._jux_sign = True
@@ -949,7 +931,7 @@ class TestEdgeCases:
             pytest_sessionfinish(mock_session, 0)
 
         # Original XML should be preserved
-        assert test_junit_xml.read_text() == original_content
+        assert test_junit_xml.read_bytes() == original_content
 
     def test_configure_loads_project_ini_file(
         self, mock_config: Mock, tmp_path: Path, monkeypatch
@@ -1086,6 +1068,7 @@ class TestAPIPublishing:
         # Call sessionfinish - should publish to API
         with pytest.warns(UserWarning, match="Report published to Jux API"):
             pytest_sessionfinish(mock_session, 0)
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
 
         # Verify API client was initialized
         mock_api_client.assert_called_once_with(
@@ -1134,6 +1117,7 @@ class TestAPIPublishing:
         # Call sessionfinish - should publish to API
         with pytest.warns(UserWarning, match="Report published to Jux API"):
             pytest_sessionfinish(mock_session, 0)
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
 
         # Verify API client was initialized with bearer token
         mock_api_client.assert_called_once_with(
@@ -1173,6 +1157,71 @@ class TestAPIPublishing:
             UserWarning, match="Failed to publish report to Jux API \\(API mode\\)"
         ):
             pytest_sessionfinish(mock_session, 0)
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
+
+    def test_api_mode_warns_when_client_cannot_be_built(
+        self,
+        mock_session: Mock,
+        test_junit_xml: Path,
+        mock_api_client: Mock,
+    ) -> None:
+        """Test that a client construction error gets the API mode warning."""
+        mock_session.config._jux_enabled = True
+        mock_session.config._jux_sign = False
+        mock_session.config._jux_publish = False
+        mock_session.config._jux_storage_mode = StorageMode.API
+        mock_session.config._jux_storage_path = None
+        mock_session.config._jux_api_url = "http://localhost:4000/api/v1"
+        mock_session.config._jux_bearer_token = None
+        mock_session.config._jux_api_timeout = 30
+        mock_session.config._jux_api_max_retries = 3
+        mock_session.config.option.xmlpath = str(test_junit_xml)
+
+        mock_api_client.side_effect = ValueError("Invalid API URL")
+
+        with pytest.warns(
+            UserWarning, match="Failed to publish report to Jux API \\(API mode\\)"
+        ):
+            pytest_sessionfinish(mock_session, 0)
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
+
+    def test_unconfigure_reports_to_stderr_without_terminal(
+        self,
+        mock_session: Mock,
+        test_junit_xml: Path,
+        tmp_path: Path,
+        mock_api_client: Mock,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that the publish outcome reaches stderr under -p no:terminal."""
+        import warnings
+
+        mock_session.config._jux_enabled = True
+        mock_session.config._jux_sign = False
+        mock_session.config._jux_publish = False
+        mock_session.config._jux_storage_mode = StorageMode.CACHE
+        mock_session.config._jux_storage_path = str(tmp_path / "reports")
+        mock_session.config._jux_api_url = "http://localhost:4000/api/v1"
+        mock_session.config._jux_bearer_token = None
+        mock_session.config._jux_api_timeout = 30
+        mock_session.config._jux_api_max_retries = 3
+        mock_session.config.option.xmlpath = str(test_junit_xml)
+
+        mock_api_client.return_value.publish_report.side_effect = Exception(
+            "Connection refused"
+        )
+
+        pytest_sessionfinish(mock_session, 0)
+        # Without a terminal reporter, pytest_terminal_summary never runs
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            pytest_unconfigure(mock_session.config)
+
+        assert caught == []
+        assert (
+            "Failed to publish report to Jux API, queued locally (CACHE mode)"
+            in capsys.readouterr().err
+        )
 
     def test_cache_mode_queues_on_api_error(
         self,
@@ -1206,6 +1255,7 @@ class TestAPIPublishing:
             match="Failed to publish report to Jux API, queued locally \\(CACHE mode\\)",
         ):
             pytest_sessionfinish(mock_session, 0)
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
 
         # Verify report was stored locally (storage creates reports/ subdir)
         reports_dir = tmp_path / "reports" / "reports"
@@ -1244,6 +1294,7 @@ class TestAPIPublishing:
             match="Failed to publish report to Jux API, local copy saved \\(BOTH mode\\)",
         ):
             pytest_sessionfinish(mock_session, 0)
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
 
         # Verify report was stored locally (storage creates reports/ subdir)
         reports_dir = tmp_path / "reports" / "reports"
@@ -1274,3 +1325,79 @@ class TestAPIPublishing:
 
         # Verify API client was NOT called
         mock_api_client.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("wait_timeout", "expected_warning"),
+        [
+            pytest.param(None, "Report published to Jux API", id="completes"),
+            pytest.param(
+                0.01,
+                "Timed out after 0.01s .*may not have been published",
+                id="times_out",
+            ),
+        ],
+    )
+    def test_publishes_in_background(
+        self,
+        mock_session: Mock,
+        test_junit_xml: Path,
+        mock_api_client: Mock,
+        wait_timeout: float | None,
+        expected_warning: str,
+    ) -> None:
+        """Test that sessionfinish does not wait for the publish to finish.
+
+        The publish thread must be a daemon, so a publish abandoned after a
+        timeout cannot hold up interpreter exit.
+        """
+        import threading
+
+        from pytest_jux.api_client import PublishResponse
+
+        mock_session.config._jux_enabled = True
+        mock_session.config._jux_sign = False
+        mock_session.config._jux_publish = True
+        mock_session.config._jux_storage_mode = None
+        mock_session.config._jux_storage_path = None
+        mock_session.config._jux_api_url = "http://localhost:4000/api/v1"
+        mock_session.config._jux_bearer_token = None
+        mock_session.config._jux_api_timeout = 30
+        mock_session.config._jux_api_max_retries = 3
+        mock_session.config.option.xmlpath = str(test_junit_xml)
+
+        # Hold the publish until the test releases it
+        release = threading.Event()
+        response = PublishResponse(
+            test_run_id="550e8400-e29b-41d4-a716-446655440000",
+            message="Test report submitted successfully",
+            test_count=1,
+            failure_count=0,
+            error_count=0,
+            skipped_count=0,
+            success_rate=100.0,
+        )
+        mock_api_client.return_value.publish_report.side_effect = lambda xml: (
+            release.wait(5) and response
+        )
+
+        pytest_sessionfinish(mock_session, 0)
+
+        future = mock_session.config._jux_publish_future
+        assert not future.done()
+        publish_threads = [
+            t for t in threading.enumerate() if t.name == "jux-publish" and t.is_alive()
+        ]
+        assert publish_threads
+        assert all(t.daemon for t in publish_threads)
+
+        if wait_timeout is None:
+            release.set()
+        else:
+            mock_session.config._jux_publish_wait_timeout = wait_timeout
+
+        with pytest.warns(UserWarning, match=expected_warning):
+            pytest_terminal_summary(Mock(), 0, mock_session.config)
+
+        release.set()
+        future.result(timeout=5)
+        mock_api_client.return_value.close.assert_called_once()
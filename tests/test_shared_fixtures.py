@@ -7,6 +7,8 @@ These tests verify that pytest-jux can handle JUnit XML files
 from the local test fixtures.
 """
 
+import copy
+import functools
 from pathlib import Path
 
 import pytest
@@ -17,6 +19,7 @@ from conftest import (
 
 # Import has_signature from juxlib (not re-exported in pytest_jux)
 from juxlib.signing import has_signature
+from lxml import etree
 
 from pytest_jux.canonicalizer import canonicalize_xml, compute_canonical_hash, load_xml
 from pytest_jux.signer import load_private_key, sign_xml
@@ -29,7 +32,16 @@ RSA_KEY_PATH = KEYS_DIR / "rsa_2048.pem"
 RSA_CERT_PATH = KEYS_DIR / "rsa_2048.crt"
 
 
-@pytest.fixture
+@functools.cache
+def load_cached_xml(xml_file: Path) -> etree._Element:
+    """Parse a fixture file once per session.
+
+    Callers must not modify the returned tree; deep-copy it first.
+    """
+    return load_xml(xml_file)
+
+
+@pytest.fixture(scope="session")
 def rsa_key():
     """Load RSA private key for signing tests."""
     if not RSA_KEY_PATH.exists():
@@ -37,7 +49,7 @@ def rsa_key():
     return load_private_key(RSA_KEY_PATH)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rsa_cert_text():
     """Load RSA certificate as text for signing tests."""
     if not RSA_CERT_PATH.exists():
@@ -56,14 +68,11 @@ class TestLocalFixtures:
     @pytest.mark.parametrize(
         "xml_file",
         LOCAL_FILES,
-        ids=lambda p: p.name if p else "none",
+        ids=lambda p: p.name,
     )
     def test_load_local_fixtures(self, xml_file: Path) -> None:
         """Verify we can load local JUnit XML fixtures."""
-        if not xml_file.exists():
-            pytest.skip(f"Fixture not available: {xml_file}")
-
-        tree = load_xml(xml_file)
+        tree = load_cached_xml(xml_file)
 
         # Local fixtures have testsuites or testsuite as root
         # Handle namespaced tags by extracting local name
@@ -73,14 +82,11 @@ class TestLocalFixtures:
     @pytest.mark.parametrize(
         "xml_file",
         LOCAL_FILES,
-        ids=lambda p: p.name if p else "none",
+        ids=lambda p: p.name,
     )
     def test_canonicalize_local_fixtures(self, xml_file: Path) -> None:
         """All local fixtures can be canonicalized."""
-        if not xml_file.exists():
-            pytest.skip(f"Fixture not available: {xml_file}")
-
-        tree = load_xml(xml_file)
+        tree = load_cached_xml(xml_file)
         c14n_bytes = canonicalize_xml(tree)
 
         assert isinstance(c14n_bytes, bytes)
@@ -89,32 +95,26 @@ class TestLocalFixtures:
     @pytest.mark.parametrize(
         "xml_file",
         LOCAL_FILES,
-        ids=lambda p: p.name if p else "none",
+        ids=lambda p: p.name,
     )
     def test_hash_is_deterministic(self, xml_file: Path) -> None:
-        """Same file produces same hash on multiple loads."""
-        if not xml_file.exists():
-            pytest.skip(f"Fixture not available: {xml_file}")
-
-        tree1 = load_xml(xml_file)
-        tree2 = load_xml(xml_file)
+        """Same document produces same hash on repeated and independent trees."""
+        tree = load_cached_xml(xml_file)
 
-        hash1 = compute_canonical_hash(tree1)
-        hash2 = compute_canonical_hash(tree2)
+        hash1 = compute_canonical_hash(tree)
+        hash2 = compute_canonical_hash(copy.deepcopy(tree))
 
         assert hash1 == hash2
 
     @pytest.mark.parametrize(
         "xml_file",
         LOCAL_FILES,
-        ids=lambda p: p.name if p else "none",
+        ids=lambda p: p.name,
     )
     def test_sign_local_fixtures(self, xml_file: Path, rsa_key, rsa_cert_text) -> None:
         """All local fixtures can be signed."""
-        if not xml_file.exists():
-            pytest.skip(f"Fixture not available: {xml_file}")
-
-        tree = load_xml(xml_file)
+        # sign_xml adds the signature to the tree in place
+        tree = copy.deepcopy(load_cached_xml(xml_file))
 
         signed_tree = sign_xml(tree, rsa_key, rsa_cert_text)
 
@@ -220,7 +220,7 @@ class TestSignXML:
 
         assert signed_tree is not None
         # Verify original content is preserved
-        assert signed_tree.find(".//testcase") is not None
+        assert next(signed_tree.iter("testcase"), None) is not None
         # Verify signature was added
         assert (
             signed_tree.find(".//{http://www.w3.org/2000/09/xmldsig#}Signature")
@@ -18,6 +18,26 @@ from pytest_jux.storage import (
 )
 
 
+@pytest.fixture(scope="session")
+def empty_storage(tmp_path_factory: pytest.TempPathFactory) -> ReportStorage:
+    """Empty storage shared by read-only tests (never write to it)."""
+    return ReportStorage(storage_path=tmp_path_factory.mktemp("empty_storage"))
+
+
+@pytest.fixture
+def stored_report(tmp_path: Path) -> tuple[ReportStorage, str, bytes]:
+    """Storage rooted at tmp_path holding one stored report.
+
+    Returns:
+        Tuple of (storage, canonical_hash, xml_content)
+    """
+    storage = ReportStorage(storage_path=tmp_path)
+    xml_content = b"<testsuite><testcase name='test1'/></testsuite>"
+    canonical_hash = "sha256:abc123def456"
+    storage.store_report(xml_content, canonical_hash)
+    return storage, canonical_hash, xml_content
+
+
 class TestGetDefaultStoragePath:
     """Tests for default storage path detection."""
 
@@ -75,17 +95,14 @@ class TestReportStorage:
         # Metadata directory no longer created (metadata in XML as of v0.3.0)
         assert not (storage_path / "metadata").exists()
 
-    def test_store_report(self, tmp_path: Path) -> None:
+    def test_store_report(
+        self, stored_report: tuple[ReportStorage, str, bytes], tmp_path: Path
+    ) -> None:
         """Should store report with canonical hash as filename.
 
         As of v0.3.0, metadata is embedded in XML, not stored separately.
         """
-        storage = ReportStorage(storage_path=tmp_path)
-
-        xml_content = b"<testsuite><testcase name='test1'/></testsuite>"
-        canonical_hash = "sha256:abc123def456"
-
-        storage.store_report(xml_content, canonical_hash)
+        _, canonical_hash, xml_content = stored_report
 
         # Report file should exist
         report_file = tmp_path / "reports" / f"{canonical_hash}.xml"
@@ -109,25 +126,18 @@ class TestReportStorage:
         temp_files = list(tmp_path.rglob("*.tmp"))
         assert len(temp_files) == 0
 
-    def test_get_report(self, tmp_path: Path) -> None:
+    def test_get_report(self, stored_report: tuple[ReportStorage, str, bytes]) -> None:
         """Should retrieve stored report."""
-        storage = ReportStorage(storage_path=tmp_path)
-
-        xml_content = b"<testsuite><testcase name='test1'/></testsuite>"
-        canonical_hash = "sha256:retrieve123"
-
-        storage.store_report(xml_content, canonical_hash)
+        storage, canonical_hash, xml_content = stored_report
 
         # Retrieve report
         retrieved = storage.get_report(canonical_hash)
         assert retrieved == xml_content
 
-    def test_get_nonexistent_report(self, tmp_path: Path) -> None:
+    def test_get_nonexistent_report(self, empty_storage: ReportStorage) -> None:
         """Should raise error for nonexistent report."""
-        storage = ReportStorage(storage_path=tmp_path)
-
         with pytest.raises(ReportNotFoundError):
-            storage.get_report("sha256:nonexistent")
+            empty_storage.get_report("sha256:nonexistent")
 
     def test_list_reports(self, tmp_path: Path) -> None:
         """Should list all stored reports."""
@@ -144,23 +154,19 @@ class TestReportStorage:
         assert len(reports) == 3
         assert all(h.startswith("sha256:test") for h in reports)
 
-    def test_list_reports_empty(self, tmp_path: Path) -> None:
+    def test_list_reports_empty(self, empty_storage: ReportStorage) -> None:
         """Should return empty list when no reports."""
-        storage = ReportStorage(storage_path=tmp_path)
-        reports = storage.list_reports()
+        reports = empty_storage.list_reports()
         assert reports == []
 
-    def test_delete_report(self, tmp_path: Path) -> None:
+    def test_delete_report(
+        self, stored_report: tuple[ReportStorage, str, bytes], tmp_path: Path
+    ) -> None:
         """Should delete report.
 
         As of v0.3.0, metadata is in XML, so only XML file needs deletion.
         """
-        storage = ReportStorage(storage_path=tmp_path)
-
-        xml_content = b"<testsuite/>"
-        canonical_hash = "sha256:delete123"
-
-        storage.store_report(xml_content, canonical_hash)
+        storage, canonical_hash, _ = stored_report
 
         # Delete report
         storage.delete_report(canonical_hash)
@@ -169,11 +175,10 @@ class TestReportStorage:
         report_file = tmp_path / "reports" / f"{canonical_hash}.xml"
         assert not report_file.exists()
 
-    def test_delete_nonexistent_report(self, tmp_path: Path) -> None:
+    def test_delete_nonexistent_report(self, empty_storage: ReportStorage) -> None:
         """Should not raise error when deleting nonexistent report."""
-        storage = ReportStorage(storage_path=tmp_path)
         # Should not raise
-        storage.delete_report("sha256:nonexistent")
+        empty_storage.delete_report("sha256:nonexistent")
 
     def test_queue_report(self, tmp_path: Path) -> None:
         """Should queue report for later publishing."""
@@ -219,18 +224,14 @@ class TestReportStorage:
         assert canonical_hash in storage.list_reports()
         assert canonical_hash not in storage.list_queued_reports()
 
-    def test_report_exists(self, tmp_path: Path) -> None:
+    def test_report_exists(
+        self, stored_report: tuple[ReportStorage, str, bytes]
+    ) -> None:
         """Should check if report exists."""
-        storage = ReportStorage(storage_path=tmp_path)
-
-        xml_content = b"<testsuite/>"
-        canonical_hash = "sha256:exists123"
-
-        assert not storage.report_exists(canonical_hash)
-
-        storage.store_report(xml_content, canonical_hash)
+        storage, canonical_hash, _ = stored_report
 
         assert storage.report_exists(canonical_hash)
+        assert not storage.report_exists("sha256:exists123")
 
     def test_get_storage_stats(self, tmp_path: Path) -> None:
         """Should return storage statistics."""
@@ -256,17 +257,14 @@ class TestReportStorage:
         assert stats["total_size"] > 0
         assert "oldest_report" in stats
 
-    def test_file_permissions_secure(self, tmp_path: Path) -> None:
+    def test_file_permissions_secure(
+        self, stored_report: tuple[ReportStorage, str, bytes], tmp_path: Path
+    ) -> None:
         """Stored files should have secure permissions."""
         if platform.system() == "Windows":
             pytest.skip("File permissions test not applicable on Windows")
 
-        storage = ReportStorage(storage_path=tmp_path)
-
-        xml_content = b"<testsuite/>"
-        canonical_hash = "sha256:perm123"
-
-        storage.store_report(xml_content, canonical_hash)
+        _, canonical_hash, _ = stored_report
 
         # Check file permissions (should be 0600 or more restrictive)
         report_file = tmp_path / "reports" / f"{canonical_hash}.xml"
@@ -297,18 +295,14 @@ class TestStorageEdgeCases:
         reports = storage.list_reports()
         assert len(reports) == 10
 
-    def test_dequeue_nonexistent_report(self, tmp_path: Path) -> None:
+    def test_dequeue_nonexistent_report(self, empty_storage: ReportStorage) -> None:
         """Should raise error when dequeuing nonexistent report."""
-        storage = ReportStorage(storage_path=tmp_path)
-
         with pytest.raises(QueuedReportNotFoundError):
-            storage.dequeue_report("sha256:nonexistent")
+            empty_storage.dequeue_report("sha256:nonexistent")
 
-    def test_get_stats_empty_storage(self, tmp_path: Path) -> None:
+    def test_get_stats_empty_storage(self, empty_storage: ReportStorage) -> None:
         """Should return zero stats for empty storage."""
-        storage = ReportStorage(storage_path=tmp_path)
-
-        stats = storage.get_stats()
+        stats = empty_storage.get_stats()
 
         assert stats["total_reports"] == 0
         assert stats["queued_reports"] == 0
@@ -550,11 +544,9 @@ class TestStorageErrorPaths:
             with pytest.raises(StorageWriteError):
                 storage.dequeue_report(test_hash)
 
-    def test_report_exists_false(self, tmp_path: Path) -> None:
+    def test_report_exists_false(self, empty_storage: ReportStorage) -> None:
         """Should return False when report doesn't exist."""
-        storage = ReportStorage(storage_path=tmp_path)
-
-        exists = storage.report_exists("sha256:nonexistent")
+        exists = empty_storage.report_exists("sha256:nonexistent")
 
         assert exists is False
 
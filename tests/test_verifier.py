@@ -6,22 +6,17 @@
 from pathlib import Path
 
 import pytest
+from conftest import KeyPair, generate_test_rsa_key
 from lxml import etree
 
 from pytest_jux.canonicalizer import load_xml
-from pytest_jux.signer import load_private_key, sign_xml
+from pytest_jux.signer import sign_xml
 from pytest_jux.verifier import verify_signature
 
 
 @pytest.fixture
-def signed_xml_rsa(tmp_path: Path) -> Path:
-    """Create a signed XML file with RSA key and certificate."""
-    from pytest_jux.commands.keygen import (
-        generate_rsa_key,
-        generate_self_signed_cert,
-        save_key,
-    )
-
+def signed_xml_rsa(tmp_path: Path, rsa_keypair: KeyPair) -> Path:
+    """Create an XML file signed with the RSA key pair and its certificate."""
     # Create test XML
     xml_content = """<?xml version="1.0"?>
 <testsuites>
@@ -33,18 +28,9 @@ def signed_xml_rsa(tmp_path: Path) -> Path:
     xml_path = tmp_path / "test.xml"
     xml_path.write_text(xml_content)
 
-    # Generate key and certificate
-    key = generate_rsa_key(2048)
-    key_path = tmp_path / "key.pem"
-    save_key(key, key_path)
-
-    cert_path = tmp_path / "cert.crt"
-    generate_self_signed_cert(key, cert_path)
-    cert = cert_path.read_bytes()
-
     # Sign XML with certificate
     tree = load_xml(xml_path)
-    signed_tree = sign_xml(tree, key, cert)
+    signed_tree = sign_xml(tree, rsa_keypair.key, rsa_keypair.cert_bytes)
 
     # Save signed XML
     signed_path = tmp_path / "signed.xml"
@@ -56,14 +42,8 @@ def signed_xml_rsa(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def signed_xml_ecdsa(tmp_path: Path) -> Path:
-    """Create a signed XML file with ECDSA key and certificate."""
-    from pytest_jux.commands.keygen import (
-        generate_ecdsa_key,
-        generate_self_signed_cert,
-        save_key,
-    )
-
+def signed_xml_ecdsa(tmp_path: Path, ecdsa_keypair: KeyPair) -> Path:
+    """Create an XML file signed with the ECDSA key pair and its certificate."""
     # Create test XML
     xml_content = """<?xml version="1.0"?>
 <testsuites>
@@ -75,18 +55,9 @@ def signed_xml_ecdsa(tmp_path: Path) -> Path:
     xml_path = tmp_path / "test.xml"
     xml_path.write_text(xml_content)
 
-    # Generate key and certificate
-    key = generate_ecdsa_key("P-256")
-    key_path = tmp_path / "key.pem"
-    save_key(key, key_path)
-
-    cert_path = tmp_path / "cert.crt"
-    generate_self_signed_cert(key, cert_path)
-    cert = cert_path.read_bytes()
-
     # Sign XML with certificate
     tree = load_xml(xml_path)
-    signed_tree = sign_xml(tree, key, cert)
+    signed_tree = sign_xml(tree, ecdsa_keypair.key, ecdsa_keypair.cert_bytes)
 
     # Save signed XML
     signed_path = tmp_path / "signed.xml"
@@ -101,23 +72,30 @@ class TestVerifySignature:
     """Tests for verify_signature function."""
 
     def test_verifies_valid_rsa_signature(
-        self, signed_xml_rsa: Path, tmp_path: Path
+        self, signed_xml_rsa: Path, rsa_keypair: KeyPair
     ) -> None:
         """Test that valid RSA signature is verified."""
-        cert_path = signed_xml_rsa.parent / "cert.crt"
-        cert = cert_path.read_bytes()
+        cert = rsa_keypair.cert_path.read_bytes()
 
         tree = load_xml(signed_xml_rsa)
         is_valid = verify_signature(tree, cert)
 
         assert is_valid is True
 
+    def test_verifies_rsa_2048(self, rsa_keypair: KeyPair) -> None:
+        """Test that a production-default RSA 2048-bit signature is verified."""
+        tree = etree.fromstring(
+            b'<testsuites><testcase name="test_example"/></testsuites>'
+        )
+        signed_tree = sign_xml(tree, rsa_keypair.key, rsa_keypair.cert_bytes)
+
+        assert verify_signature(signed_tree, rsa_keypair.cert_bytes) is True
+
     def test_verifies_valid_ecdsa_signature(
-        self, signed_xml_ecdsa: Path, tmp_path: Path
+        self, signed_xml_ecdsa: Path, ecdsa_keypair: KeyPair
     ) -> None:
         """Test that valid ECDSA signature is verified."""
-        cert_path = signed_xml_ecdsa.parent / "cert.crt"
-        cert = cert_path.read_bytes()
+        cert = ecdsa_keypair.cert_path.read_bytes()
 
         tree = load_xml(signed_xml_ecdsa)
         is_valid = verify_signature(tree, cert)
@@ -125,15 +103,14 @@ class TestVerifySignature:
         assert is_valid is True
 
     def test_rejects_tampered_signature(
-        self, signed_xml_rsa: Path, tmp_path: Path
+        self, signed_xml_rsa: Path, rsa_keypair: KeyPair
     ) -> None:
         """Test that tampered XML is rejected."""
-        cert_path = signed_xml_rsa.parent / "cert.crt"
-        cert = cert_path.read_bytes()
+        cert = rsa_keypair.cert_path.read_bytes()
 
         # Tamper with the XML
         tree = load_xml(signed_xml_rsa)
-        testcase = tree.find(".//testcase")
+        testcase = next(tree.iter("testcase"), None)
         assert testcase is not None
         testcase.set("name", "tampered_test")
 
@@ -143,8 +120,6 @@ class TestVerifySignature:
 
     def test_rejects_unsigned_xml(self, tmp_path: Path) -> None:
         """Test that unsigned XML is rejected."""
-        from pytest_jux.commands.keygen import generate_rsa_key
-
         # Create unsigned XML
         xml_content = """<?xml version="1.0"?>
 <testsuites>
@@ -156,7 +131,7 @@ class TestVerifySignature:
         xml_path = tmp_path / "unsigned.xml"
         xml_path.write_text(xml_content)
 
-        key = generate_rsa_key(2048)
+        key = generate_test_rsa_key()
         cert = key.public_key()
 
         tree = load_xml(xml_path)
@@ -165,21 +140,11 @@ class TestVerifySignature:
             verify_signature(tree, cert)
 
     def test_verifies_with_certificate_bytes(
-        self, signed_xml_rsa: Path, tmp_path: Path
+        self, signed_xml_rsa: Path, rsa_keypair: KeyPair
     ) -> None:
         """Test verification with certificate as bytes."""
-        from pytest_jux.commands.keygen import generate_self_signed_cert
-
-        key_path = signed_xml_rsa.parent / "key.pem"
-        key = load_private_key(key_path)
-
-        # Generate certificate
-        cert_path = tmp_path / "cert.crt"
-        generate_self_signed_cert(key, cert_path)
-        cert_bytes = cert_path.read_bytes()
-
         tree = load_xml(signed_xml_rsa)
-        is_valid = verify_signature(tree, cert_bytes)
+        is_valid = verify_signature(tree, rsa_keypair.cert_bytes)
 
         assert is_valid is True
 
@@ -191,11 +156,10 @@ class TestVerifySignature:
             verify_signature(tree, b"invalid certificate data")
 
     def test_verifies_with_certificate_string(
-        self, signed_xml_rsa: Path, tmp_path: Path
+        self, signed_xml_rsa: Path, rsa_keypair: KeyPair
     ) -> None:
         """Test verification with certificate as string."""
-        cert_path = signed_xml_rsa.parent / "cert.crt"
-        cert_str = cert_path.read_text()
+        cert_str = rsa_keypair.cert_path.read_text()
 
         tree = load_xml(signed_xml_rsa)
         is_valid = verify_signature(tree, cert_str)
@@ -206,12 +170,10 @@ class TestVerifySignature:
         reason="XMLDSig verification with public key object without cert not fully supported"
     )
     def test_verifies_with_public_key_object(
-        self, signed_xml_rsa: Path, tmp_path: Path
+        self, signed_xml_rsa: Path, rsa_keypair: KeyPair
     ) -> None:
         """Test verification with public key object (extracts from signature)."""
-        key_path = signed_xml_rsa.parent / "key.pem"
-        key = load_private_key(key_path)
-        public_key = key.public_key()
+        public_key = rsa_keypair.key.public_key()
 
         tree = load_xml(signed_xml_rsa)
         # When public key object is provided, verifier extracts key from signature
@@ -221,8 +183,6 @@ class TestVerifySignature:
 
     def test_verification_failure_with_public_key(self, tmp_path: Path) -> None:
         """Test verification fails with wrong public key."""
-        from pytest_jux.commands.keygen import generate_rsa_key
-
         # Create tampered signed XML
         xml_content = """<?xml version="1.0"?>
 <testsuites>
@@ -235,7 +195,7 @@ class TestVerifySignature:
         xml_path.write_text(xml_content)
 
         # Sign with one key
-        key1 = generate_rsa_key(2048)
+        key1 = generate_test_rsa_key()
         tree = load_xml(xml_path)
         from pytest_jux.commands.keygen import generate_self_signed_cert
 
@@ -245,12 +205,12 @@ class TestVerifySignature:
         signed_tree = sign_xml(tree, key1, cert)
 
         # Tamper with content
-        testcase = signed_tree.find(".//testcase")
+        testcase = next(signed_tree.iter("testcase"), None)
         assert testcase is not None
         testcase.set("name", "tampered_test")
 
         # Try to verify with different public key
-        key2 = generate_rsa_key(2048)
+        key2 = generate_test_rsa_key()
         public_key2 = key2.public_key()
 
         # Verification should fail (tampered content)